@@ -0,0 +1,78 @@
+"""
+進程內異步 TTL 緩存
+用於合併短時間內對同一 REST 端點的重複請求（錢包餘額、訂單簿等）
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+def ttl_cache(ttl: float, key: Optional[Callable[..., Hashable]] = None, maxsize: int = 128):
+    """
+    異步函數的 TTL 緩存裝飾器
+
+    - 結果在 ttl 秒內直接返回緩存值，調用方需能接受這一時間窗口內的數據滯後
+    - 同一鍵的併發未命中共享同一個進行中的請求（single-flight）
+    - 異常和取消不會被緩存
+    - 過期條目在查找時移除；條目數超過 maxsize 時淘汰最久未使用的條目
+    - 被裝飾函數提供 cache_clear() 用於在狀態變更後主動失效
+
+    Args:
+        ttl: 緩存有效期（秒）
+        key: 由調用參數生成緩存鍵的函數，默認使用全部位置參數和關鍵字參數
+        maxsize: 最多保留的緩存條目數
+    """
+    def decorator(func):
+        entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[Hashable, asyncio.Task] = {}
+
+        def _make_key(args, kwargs) -> Hashable:
+            if key is not None:
+                return key(*args, **kwargs)
+            return args + tuple(sorted(kwargs.items()))
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = _make_key(args, kwargs)
+
+            entry = entries.get(cache_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    entries.move_to_end(cache_key)
+                    return entry[1]
+                del entries[cache_key]
+
+            task = inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[cache_key] = task
+
+                def _store(done: asyncio.Task, cache_key=cache_key):
+                    inflight.pop(cache_key, None)
+                    if not done.cancelled() and done.exception() is None:
+                        entries[cache_key] = (time.monotonic() + ttl, done.result())
+                        entries.move_to_end(cache_key)
+                        while len(entries) > maxsize:
+                            entries.popitem(last=False)
+
+                task.add_done_callback(_store)
+            else:
+                log.debug(f"Joining in-flight call to {func.__qualname__}")
+
+            # shield: 單個調用方被取消不應中斷其他等待者共享的請求
+            return await asyncio.shield(task)
+
+        def cache_clear():
+            """清空緩存（進行中的請求不受影響）"""
+            entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
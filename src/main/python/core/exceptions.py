@@ -3,6 +3,7 @@
 提供分層的異常處理體系以支持更精確的錯誤處理
 """
 
+import inspect
 import logging
 from typing import Optional, Dict, Any
 
@@ -213,19 +214,33 @@ def handle_api_errors(func):
     return wrapper
 
 
+def _translate_database_error(e: Exception) -> DatabaseError:
+    """將底層異常映射為對應的數據庫異常"""
+    error_message = str(e).lower()
+    
+    if 'connection' in error_message or 'connect' in error_message:
+        return DatabaseConnectionError(f"Database connection failed: {str(e)}")
+    elif 'query' in error_message or 'syntax' in error_message:
+        return DatabaseQueryError(f"Database query failed: {str(e)}")
+    else:
+        return DatabaseError(f"Database error: {str(e)}")
+
+
 def handle_database_errors(func):
-    """數據庫錯誤處理裝飾器"""
+    """數據庫錯誤處理裝飾器（同時支持生成器函數，迭代期間的異常同樣會被轉換）"""
+    if inspect.isgeneratorfunction(func):
+        def generator_wrapper(*args, **kwargs):
+            try:
+                yield from func(*args, **kwargs)
+            except Exception as e:
+                raise _translate_database_error(e) from e
+        
+        return generator_wrapper
+    
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            error_message = str(e).lower()
-            
-            if 'connection' in error_message or 'connect' in error_message:
-                raise DatabaseConnectionError(f"Database connection failed: {str(e)}") from e
-            elif 'query' in error_message or 'syntax' in error_message:
-                raise DatabaseQueryError(f"Database query failed: {str(e)}") from e
-            else:
-                raise DatabaseError(f"Database error: {str(e)}") from e
+            raise _translate_database_error(e) from e
     
     return wrapper 
\ No newline at end of file
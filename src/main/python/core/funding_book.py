@@ -0,0 +1,78 @@
+"""
+資金訂單簿歸約
+將 get_f_book 返回的條目歸約為每個期限的最優 bid / offer 利率
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+# 低於此條目數時，NumPy 的調用開銷超過向量化歸約帶來的收益
+NUMPY_MIN_BOOK_SIZE = 32
+
+
+def _reduce_book_python(book) -> Dict[int, Dict[str, float]]:
+    """純 Python 單次遍歷，求每個期限的最高 bid 和最低 offer 利率"""
+    market_rates = {}
+    for entry in book:
+        period = entry.period
+        rate = entry.rate
+        amount = entry.amount
+
+        if period not in market_rates:
+            market_rates[period] = {'bid': 0.0, 'offer': float('inf')}  # 以極值初始化
+
+        if amount < 0:  # Bid (借入方)
+            if rate > market_rates[period]['bid']:
+                market_rates[period]['bid'] = rate
+        elif amount > 0:  # Offer (借出方)
+            if rate < market_rates[period]['offer']:
+                market_rates[period]['offer'] = rate
+    return market_rates
+
+
+def _reduce_book_numpy(book) -> Dict[int, Dict[str, float]]:
+    """與 _reduce_book_python 相同的歸約，按期限分組後用 ufunc.at 求極值"""
+    count = len(book)
+    rates = np.fromiter((e.rate for e in book), dtype=np.float64, count=count)
+    amounts = np.fromiter((e.amount for e in book), dtype=np.float64, count=count)
+    periods = np.fromiter((e.period for e in book), dtype=np.int64, count=count)
+
+    unique_periods, inverse = np.unique(periods, return_inverse=True)
+    bids = np.zeros(len(unique_periods), dtype=np.float64)
+    offers = np.full(len(unique_periods), np.inf, dtype=np.float64)
+
+    bid_mask = amounts < 0
+    offer_mask = amounts > 0
+    np.maximum.at(bids, inverse[bid_mask], rates[bid_mask])
+    np.minimum.at(offers, inverse[offer_mask], rates[offer_mask])
+
+    return {
+        int(period): {'bid': float(bid), 'offer': float(offer)}
+        for period, bid, offer in zip(unique_periods, bids, offers)
+    }
+
+
+def reduce_book(book) -> Dict[int, Dict[str, float]]:
+    """
+    按訂單簿大小選擇純 Python 或 NumPy 歸約
+
+    Returns:
+        {period: {'bid': rate, 'offer': rate}}，缺失的一側為 0.0 (bid) 或 inf (offer)
+    """
+    if len(book) < NUMPY_MIN_BOOK_SIZE:
+        return _reduce_book_python(book)
+    return _reduce_book_numpy(book)
+
+
+def finalize_market_rates(market_rates: Dict[int, Dict[str, float]]) -> Dict[int, Dict[str, Optional[float]]]:
+    """移除兩側都沒有報價的期限，並將缺失的一側（0.0 bid / inf offer）替換為 None"""
+    for period in list(market_rates.keys()):
+        if market_rates[period]['bid'] == 0.0 and market_rates[period]['offer'] == float('inf'):
+            del market_rates[period]  # 該期限沒有任何 bid 或 offer
+        else:
+            if market_rates[period]['bid'] == 0.0:
+                market_rates[period]['bid'] = None  # 該期限沒有 bid
+            if market_rates[period]['offer'] == float('inf'):
+                market_rates[period]['offer'] = None  # 該期限沒有 offer
+    return market_rates
@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import List, Dict, Any, Optional
 
 from src.main.python.core.config import AppConfig
+from src.main.python.core.cache import ttl_cache
 from src.main.python.core.exceptions import (
     MarketDataError, create_market_data_unavailable_error, handle_api_errors
 )
@@ -40,6 +41,16 @@ class BaseStrategy(ABC):
         """
         pass
 
+    @ttl_cache(ttl=10)
+    async def _get_funding_book(self, symbol: str):
+        """獲取資金訂單簿，10 秒內的重複請求共享同一結果"""
+        return await asyncio.to_thread(
+            self.api_client.rest.public.get_f_book, 
+            symbol, 
+            precision="P0", 
+            len=100
+        )
+
     @handle_api_errors
     async def analyze_and_log_market(self) -> Optional[Dict[int, Dict[str, Optional[float]]]]:
         """
@@ -53,12 +64,7 @@ class BaseStrategy(ABC):
         
         try:
             # 獲取資金訂單簿
-            book = await asyncio.to_thread(
-                self.api_client.rest.public.get_f_book, 
-                symbol, 
-                precision="P0", 
-                len=100
-            )
+            book = await self._get_funding_book(symbol)
             
             if not book:
                 raise create_market_data_unavailable_error(symbol)
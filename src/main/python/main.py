@@ -2,12 +2,14 @@ import asyncio
 import time
 import logging
 import importlib
+import re
 from decimal import Decimal
 from dotenv import load_dotenv
 from bfxapi import Client
 from typing import Optional
 
 from src.main.python.core.config import get_config_manager, AppConfig
+from src.main.python.core.cache import ttl_cache
 from src.main.python.core.exceptions import (
     FundingBotError, ConfigurationError, StrategyLoadError, 
     InsufficientBalanceError, InvalidOrderError, create_strategy_load_error,
@@ -15,6 +17,7 @@ from src.main.python.core.exceptions import (
 )
 from src.main.python.services.database_manager import DatabaseManager
 from src.main.python.repositories.market_log_repository import MarketLogRepository
+from src.main.python.repositories.interest_payment_repository import InterestPaymentRepository
 from src.main.python.models.market_log import MarketLog
 from src.main.python.models.lending_order import LendingOrder, OrderStatus
 from src.main.python.models.interest_payment import InterestPayment
@@ -24,6 +27,13 @@ from datetime import datetime
 
 log = logging.getLogger('FundingBot')
 
+# 資金收益相關的 ledger 描述關鍵字（一次掃描，無需 lower()）
+_FUNDING_RE = re.compile(r'funding|interest|lending', re.IGNORECASE)
+
+# Ledger 分頁同步參數（Bitfinex 認證端點約 90 次/分鐘）
+_LEDGER_PAGE_SIZE = 250
+_LEDGER_PAGE_DELAY_SECONDS = 0.6
+
 class FundingBot:
     """
     基於策略驅動的資金借貸機器人
@@ -50,6 +60,7 @@ class FundingBot:
             )
             self.db_manager = DatabaseManager(self.config.database)
             self.market_log_repo = MarketLogRepository(self.db_manager)
+            self.interest_payment_repo = InterestPaymentRepository(self.db_manager)
             
             # --- Load Strategy ---
             self.strategy = self._load_strategy()
@@ -109,22 +120,32 @@ class FundingBot:
             log.error(f"Failed to load strategy: {error}")
             raise error
 
+    @ttl_cache(ttl=10)
+    async def _get_wallets_map(self) -> dict:
+        """
+        獲取錢包列表並一次性索引為 {(wallet_type, currency): wallet}
+        
+        結果緩存 10 秒；下單或撤單後會主動失效，避免讀到舊餘額。
+        """
+        wallets = await asyncio.to_thread(self.bfx.rest.auth.get_wallets)
+        return {(wallet.wallet_type, wallet.currency): wallet for wallet in wallets}
+
     @handle_api_errors
     async def get_available_balance(self) -> Decimal:
         """獲取資金錢包中的可用餘額"""
         currency = self.config.trading.lending_currency
         
         try:
-            wallets = await asyncio.to_thread(self.bfx.rest.auth.get_wallets)
+            wallets = await self._get_wallets_map()
+            wallet = wallets.get(("funding", currency))
             
-            for wallet in wallets:
-                if wallet.wallet_type == "funding" and wallet.currency == currency:
-                    balance = Decimal(str(wallet.available_balance))
-                    log.info(f"Available balance in funding wallet: {balance:.2f} {currency}")
-                    return balance
+            if wallet is None:
+                log.warning(f"No funding wallet found for {currency}")
+                return Decimal('0.0')
             
-            log.warning(f"No funding wallet found for {currency}")
-            return Decimal('0.0')
+            balance = Decimal(str(wallet.available_balance))
+            log.info(f"Available balance in funding wallet: {balance:.2f} {currency}")
+            return balance
             
         except Exception as e:
             log.error(f"Failed to get available balance: {e}")
@@ -145,19 +166,17 @@ class FundingBot:
 
             log.info(f"Found {len(offers)} active offers for {symbol}. Cancelling them...")
             
-            cancelled_count = 0
-            failed_count = 0
+            # 使用 cancel/all 端點一次取消，避免逐筆請求的 N 次往返
+            notification = await asyncio.to_thread(
+                self.bfx.rest.auth.cancel_all_funding_offers, currency
+            )
             
-            for offer in offers:
-                try:
-                    await asyncio.to_thread(self.bfx.rest.auth.cancel_funding_offer, offer.id)
-                    log.info(f"Successfully cancelled offer ID: {offer.id}")
-                    cancelled_count += 1
-                except Exception as e:
-                    log.error(f"Failed to cancel offer ID: {offer.id}. Reason: {e}")
-                    failed_count += 1
-                    
-            log.info(f"Cancellation complete: {cancelled_count} successful, {failed_count} failed")
+            if notification.status != "SUCCESS":
+                log.error(f"Failed to cancel offers for {symbol}. Reason: {notification.text}")
+                return
+            
+            log.info(f"Cancellation complete: {len(offers)} offers cancelled for {symbol}")
+            self._get_wallets_map.cache_clear()
             
         except Exception as e:
             log.error(f"Error fetching or cancelling funding offers: {e}")
@@ -196,6 +215,7 @@ class FundingBot:
             )
             
             log.info("Offer placed successfully")
+            self._get_wallets_map.cache_clear()
             
             # 創建 LendingOrder 記錄
             await self._create_lending_order_record(
@@ -270,50 +290,69 @@ class FundingBot:
         except Exception as e:
             log.error(f"Error syncing order status: {e}")
     
-    async def sync_interest_payments(self):
-        """同步利息支付記錄"""
+    async def sync_interest_payments(self, max_pages: int = 40):
+        """
+        同步利息支付記錄
+        
+        以 `end` 時間戳為游標從新到舊逐頁拉取 ledger，每頁批量寫入。
+        當某頁的收益記錄全部已存在（追上上次同步的位置）或返回不足一頁時停止，
+        之後的運行只拉新增部分。每次最多拉取 max_pages 頁：超出此範圍的更早歷史
+        不會被後續運行補回（會先在已同步的記錄處停止），需使用
+        tools/fetch_historical_interest.py 回補。
+        """
         try:
             log.info("Syncing interest payments from Bitfinex ledger...")
             
             currency = self.config.trading.lending_currency
-            
-            # 獲取最近的 ledger 記錄
-            ledgers = await asyncio.to_thread(
-                self.bfx.rest.auth.get_ledgers,
-                currency=currency,
-                limit=250  # 增加獲取數量以確保覆蓋
-            )
-            
-            # 過濾出資金相關的收益記錄
-            funding_payments = [
-                ledger for ledger in ledgers 
-                if hasattr(ledger, 'description') and ledger.description and 
-                any(keyword in ledger.description.lower() for keyword in ['funding', 'interest', 'lending'])
-            ]
-            
-            log.info(f"Found {len(funding_payments)} potential interest payment records from API.")
-            
+            next_end = None
             saved_count = 0
             skipped_count = 0
             
-            for ledger in funding_payments:
-                try:
-                    interest_payment = InterestPayment.from_ledger_entry({
-                        'id': ledger.id,
-                        'currency': ledger.currency,
-                        'amount': ledger.amount,
-                        'mts': ledger.mts,
-                        'description': ledger.description
-                    })
-                    
-                    # 保存到資料庫，如果不存在
-                    if self.interest_payment_repo.save_if_not_exists(interest_payment):
-                        saved_count += 1
-                    else:
-                        skipped_count += 1
-                        
-                except Exception as e:
-                    log.warning(f"Error processing ledger entry {ledger.id}: {e}")
+            for page_number in range(1, max_pages + 1):
+                ledgers = await asyncio.to_thread(
+                    self.bfx.rest.auth.get_ledgers,
+                    currency=currency,
+                    end=next_end,
+                    limit=_LEDGER_PAGE_SIZE
+                )
+                
+                if not ledgers:
+                    break
+                
+                # 過濾出資金相關的收益記錄
+                funding_payments = [
+                    ledger for ledger in ledgers 
+                    if ledger.description and _FUNDING_RE.search(ledger.description)
+                ]
+                
+                log.info(f"Page {page_number}: found {len(funding_payments)} potential interest payment records from API.")
+                
+                payments = []
+                for ledger in funding_payments:
+                    try:
+                        payments.append(InterestPayment.from_ledger_entry(ledger))
+                    except Exception as e:
+                        log.warning(f"Error processing ledger entry {ledger.id}: {e}")
+                
+                # 一次批量寫入（ON CONFLICT DO NOTHING），取代逐筆保存
+                page_saved, page_skipped = await asyncio.to_thread(
+                    self.interest_payment_repo.save_payments_batch, payments
+                )
+                saved_count += page_saved
+                skipped_count += page_skipped
+                
+                # 已追上上次同步的位置，或已是最後一頁
+                if (payments and page_saved == 0) or len(ledgers) < _LEDGER_PAGE_SIZE:
+                    break
+                
+                next_end = min(ledger.mts for ledger in ledgers) - 1
+                await asyncio.sleep(_LEDGER_PAGE_DELAY_SECONDS)  # 避免觸發 API 速率限制
+            else:
+                log.warning(
+                    f"Stopped after {max_pages} ledger pages before catching up; entries older than "
+                    f"{datetime.fromtimestamp(next_end / 1000)} were not synced. "
+                    f"Run tools/fetch_historical_interest.py to backfill them."
+                )
             
             log.info(f"Interest sync complete. Saved: {saved_count}, Skipped (already exist): {skipped_count}")
             
@@ -327,13 +366,19 @@ class FundingBot:
             
             # TODO: 實現基本收益報告
             # 1. 統計所有 LendingOrder 的預期收益
-            # 2. 統計所有 InterestPayment 的實際收益
-            # 3. 計算差異和收益率
-            # 4. 輸出報告到日誌
+            # 2. 計算差異和收益率
+            # 3. 輸出報告到日誌
+            
+            currency = self.config.trading.lending_currency
+            
+            # 實際收益直接在數據庫端 SUM，不加載明細
+            actual_interest = await asyncio.to_thread(
+                self.interest_payment_repo.sum_amount, currency
+            )
             
             log.info("=== 收益報告 ===")
             log.info("預期收益: 待實現")
-            log.info("實際收益: 待實現") 
+            log.info(f"實際收益: {actual_interest:.8f} {currency}")
             log.info("收益差異: 待實現")
             log.info("平均收益率: 待實現")
             log.info("===============")
@@ -8,9 +8,9 @@ class DailyProfit:
     """
     每日收益數據
     """
-    id: Optional[int] = None
     currency: str
     interest_income: Decimal
     total_loan: Decimal
     type: str
     date: date
+    id: Optional[int] = None
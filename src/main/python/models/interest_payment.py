@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Union
 from decimal import Decimal
 import re
 
-@dataclass
+@dataclass(slots=True)
 class InterestPayment:
     """代表從 Bitfinex API 獲取的單筆利息收入記錄，作為一個純粹的數據容器。"""
     
@@ -22,12 +22,13 @@ class InterestPayment:
     id: Optional[int] = None
     
     @classmethod
-    def from_ledger_entry(cls, entry: dict) -> 'InterestPayment':
+    def from_ledger_entry(cls, entry: Union[dict, Any]) -> 'InterestPayment':
         """
-        從 Bitfinex Ledger 條目字典創建 InterestPayment 實例。
+        從 Bitfinex Ledger 條目創建 InterestPayment 實例。
         
         Args:
-            entry: 從 bfxapi 的 get_ledgers 返回的單個條目，已轉換為字典。
+            entry: 字典，或 bfxapi 的 get_ledgers 返回的帶有 id/currency/amount/mts/description
+                屬性的對象（可直接傳入，無需先轉換為字典）。
             
         Returns:
             一個 InterestPayment 實例。
@@ -35,23 +36,27 @@ class InterestPayment:
         Raises:
             ValueError: 如果 'id' 或 'mts' 欄位缺失。
         """
+        if isinstance(entry, dict):
+            _get = entry.get
+        else:
+            _get = lambda key, default=None: getattr(entry, key, default)
         
         # 驗證必要欄位
-        ledger_id = entry.get('id')
+        ledger_id = _get('id')
         if not ledger_id:
             raise ValueError("Ledger entry must have an 'id'")
             
-        paid_at_ms = entry.get('mts')
+        paid_at_ms = _get('mts')
         if not paid_at_ms:
             raise ValueError("Ledger entry must have 'mts' (timestamp)")
 
         # 創建實例
         instance = cls(
             ledger_id=ledger_id,
-            currency=entry.get('currency', 'UNKNOWN'),
-            amount=Decimal(str(entry.get('amount', '0.0'))),
+            currency=_get('currency', 'UNKNOWN'),
+            amount=Decimal(str(_get('amount', '0.0'))),
             paid_at=datetime.fromtimestamp(paid_at_ms / 1000.0),
-            description=entry.get('description', '')
+            description=_get('description', '')
         )
         
         # 從描述中提取 Order ID
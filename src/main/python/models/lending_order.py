@@ -84,7 +84,7 @@ class LendingOrder:
     def calculate_actual_total_interest(self) -> Decimal:
         """計算實際收到的總利息"""
         payments = self.get_related_interest_payments()
-        return sum(payment.calculate_net_amount() for payment in payments)
+        return sum((payment.calculate_net_amount() for payment in payments), Decimal('0'))
     
     def calculate_interest_variance(self) -> Decimal:
         """計算預期與實際利息的差異"""
@@ -94,10 +94,11 @@ class LendingOrder:
     
     def calculate_interest_variance_percentage(self) -> Optional[Decimal]:
         """計算利息差異百分比"""
+        # 預期利息只計算一次；訂單會隨 API 更新而變化，因此不做跨調用緩存
         expected = self.calculate_expected_interest()
         if expected == 0:
             return None
-        variance = self.calculate_interest_variance()
+        variance = self.calculate_actual_total_interest() - expected
         return (variance / expected) * 100
     
     def get_actual_period_days(self) -> Optional[int]:
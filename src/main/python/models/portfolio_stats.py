@@ -3,7 +3,7 @@ from datetime import datetime, date
 from typing import Optional, Dict, List
 from decimal import Decimal
 
-@dataclass
+@dataclass(slots=True)
 class CurrencyAllocation:
     """
     幣種配置信息
@@ -16,7 +16,7 @@ class CurrencyAllocation:
     avg_rate: Decimal                          # 平均利率
     total_orders: int                          # 總訂單數
 
-@dataclass  
+@dataclass(slots=True)
 class PeriodAllocation:
     """
     期限配置信息
@@ -28,7 +28,7 @@ class PeriodAllocation:
     order_count: int                          # 訂單數量
     expected_return: Decimal                  # 預期收益
 
-@dataclass
+@dataclass(slots=True)
 class StrategyAllocation:
     """
     策略配置信息
@@ -41,7 +41,7 @@ class StrategyAllocation:
     avg_return: Decimal                       # 平均收益率
     last_used: datetime                       # 最後使用時間
 
-@dataclass
+@dataclass(slots=True)
 class RiskMetrics:
     """
     風險指標
@@ -172,15 +172,10 @@ class PortfolioStats:
     
     def needs_rebalancing(self) -> bool:
         """檢查是否需要重新平衡"""
-        # 檢查利用率是否偏離目標太多
+        # 先做常數時間的檢查：利用率是否偏離目標太多、風險評分是否過高
         utilization_deviation = abs(self.overall_utilization - self.target_utilization)
+        if utilization_deviation > 10 or self.risk_metrics.risk_score > 75:
+            return True
         
-        # 檢查是否有過度集中的配置
-        max_currency_allocation = max(
-            (alloc.allocation_percentage for alloc in self.currency_allocations),
-            default=Decimal('0')
-        )
-        
-        return (utilization_deviation > 10 or 
-                max_currency_allocation > 70 or
-                self.risk_metrics.risk_score > 75) 
\ No newline at end of file
+        # 最後才遍歷配置，檢查是否有過度集中的幣種（命中即停止）
+        return any(alloc.allocation_percentage > 70 for alloc in self.currency_allocations) 
\ No newline at end of file
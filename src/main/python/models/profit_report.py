@@ -13,7 +13,7 @@ class ReportPeriod(Enum):
     YEARLY = "YEARLY"       # 年報
     CUSTOM = "CUSTOM"       # 自定義期間
 
-@dataclass
+@dataclass(slots=True)
 class ProfitMetrics:
     """
     收益指標集合
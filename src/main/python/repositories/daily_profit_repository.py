@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from typing import List, Optional
+import psycopg2.extras
 
 from src.main.python.services.database_manager import DatabaseManager, handle_database_errors
 from src.main.python.models.daily_profit import DailyProfit
@@ -70,3 +71,47 @@ class DailyProfitRepository:
         else:
             log.warning(f"Failed to save daily profit for {profit.currency} on {profit.date}")
             return None
+
+    @handle_database_errors
+    def save_daily_profits_batch(self, profits: List[DailyProfit]) -> int:
+        """
+        以單條 UPSERT 批量保存每日收益記錄，取代逐筆 save_daily_profit。
+        
+        Args:
+            profits: DailyProfit 對象的列表。
+            
+        Returns:
+            插入或更新的記錄數。
+        """
+        if not profits:
+            return 0
+
+        query = """
+        INSERT INTO daily_profits (currency, interest_income, total_loan, type, date)
+        VALUES %s
+        ON CONFLICT (currency, date, type) DO UPDATE SET
+            interest_income = EXCLUDED.interest_income,
+            total_loan = EXCLUDED.total_loan;
+        """
+
+        # 同一語句內不能對同一行 DO UPDATE 兩次，相同鍵只保留最後一筆
+        rows_by_key = {
+            (p.currency, p.date, p.type): (
+                p.currency, p.interest_income, p.total_loan, p.type, p.date
+            )
+            for p in profits
+        }
+        data_to_upsert = list(rows_by_key.values())
+
+        with self.db_manager.get_transaction() as conn:
+            with conn.cursor() as cur:
+                psycopg2.extras.execute_values(
+                    cur,
+                    query,
+                    data_to_upsert,
+                    page_size=len(data_to_upsert)
+                )
+                affected_count = cur.rowcount
+
+        log.info(f"Saved {affected_count} daily profit records in one batch")
+        return affected_count
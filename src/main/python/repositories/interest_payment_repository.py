@@ -1,5 +1,7 @@
 import logging
-from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, Optional, Tuple
 import psycopg2.extras
 
 from src.main.python.services.database_manager import DatabaseManager, handle_database_errors
@@ -11,6 +13,26 @@ class InterestPaymentRepository:
     """
     管理 InterestPayment 對象的數據庫操作，專為 PostgreSQL 設計。
     """
+    # 批量寫入時每條 INSERT 語句包含的記錄數
+    BATCH_PAGE_SIZE = 1000
+
+    # 表結構及索引的 DDL；作為一個腳本整體執行，也供 tools/init_db.py 復用
+    # paid_at 倒序索引使「最近 N 筆」查詢可以直接走索引掃描而無需全表排序
+    SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS interest_payments (
+        id SERIAL PRIMARY KEY,
+        ledger_id BIGINT UNIQUE NOT NULL,
+        order_id BIGINT,
+        currency VARCHAR(10) NOT NULL,
+        amount NUMERIC(20, 10) NOT NULL,
+        paid_at TIMESTAMPTZ NOT NULL,
+        description TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    CREATE INDEX IF NOT EXISTS idx_interest_payments_paid_at
+        ON interest_payments (paid_at DESC);
+    """
+
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self._create_table_if_not_exists()
@@ -21,19 +43,8 @@ class InterestPaymentRepository:
         如果 interest_payments 表不存在，則創建它。
         此方法是私有的，應在初始化時調用。
         """
-        query = """
-        CREATE TABLE IF NOT EXISTS interest_payments (
-            id SERIAL PRIMARY KEY,
-            ledger_id BIGINT UNIQUE NOT NULL,
-            order_id BIGINT,
-            currency VARCHAR(10) NOT NULL,
-            amount NUMERIC(20, 10) NOT NULL,
-            paid_at TIMESTAMPTZ NOT NULL,
-            description TEXT,
-            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-        );
-        """
-        self.db_manager.execute_query(query)
+        # 建表和建索引在同一次往返、同一個事務中完成
+        self.db_manager.execute_query(self.SCHEMA_SQL)
         log.info("Table 'interest_payments' is ready.")
 
     @handle_database_errors
@@ -78,55 +89,92 @@ class InterestPaymentRepository:
             return None
 
     @handle_database_errors
-    def save_payments_batch(self, payments: List[InterestPayment]) -> tuple[int, int]:
+    def save_payments_batch(self, payments: Iterable[InterestPayment]) -> Tuple[int, int]:
         """
-        批量保存利息支付記錄列表，並跳過已存在的記錄。
+        批量保存利息支付記錄，並跳過已存在的記錄。
+        
+        記錄以生成器方式逐條轉換為參數元組並分頁寫入，可直接傳入生成器而無需先構造列表。
         
         Args:
-            payments: InterestPayment 對象的列表。
+            payments: InterestPayment 對象的可迭代對象。
             
         Returns:
             一個元組 (inserted_count, skipped_count)。
         """
-        if not payments:
-            return 0, 0
-
         query = """
         INSERT INTO interest_payments 
         (ledger_id, order_id, currency, amount, paid_at, description)
         VALUES %s
-        ON CONFLICT (ledger_id) DO NOTHING;
+        ON CONFLICT (ledger_id) DO NOTHING
+        RETURNING id;
         """
         
-        data_to_insert = [
-            (
-                p.ledger_id, p.order_id, p.currency, p.amount, 
-                p.paid_at, p.description
-            )
-            for p in payments if p.ledger_id
-        ]
+        total_count = 0
         
-        if not data_to_insert:
-            return 0, len(payments)
+        def _rows():
+            nonlocal total_count
+            for p in payments:
+                total_count += 1
+                if p.ledger_id:
+                    yield (
+                        p.ledger_id, p.order_id, p.currency, p.amount,
+                        p.paid_at, p.description
+                    )
 
         inserted_count = 0
         with self.db_manager.get_connection() as conn:
             try:
                 with conn.cursor() as cur:
-                    psycopg2.extras.execute_values(
+                    # RETURNING + fetch=True 匯總所有分頁實際插入的行，
+                    # 因此分頁寫入時插入數依然準確（rowcount 只反映最後一頁）
+                    inserted_rows = psycopg2.extras.execute_values(
                         cur,
                         query,
-                        data_to_insert,
+                        _rows(),
                         template=None,
-                        page_size=100
+                        page_size=self.BATCH_PAGE_SIZE,
+                        fetch=True
                     )
-                    inserted_count = cur.rowcount
+                    inserted_count = len(inserted_rows)
                 conn.commit() # <--- 關鍵修復：提交交易
             except Exception as e:
                 log.error(f"Batch insert failed, rolling back transaction: {e}")
                 conn.rollback() # <--- 關鍵修復：錯誤時回滾
                 raise # 重新拋出異常，讓上層知道出錯了
 
-        skipped_count = len(payments) - inserted_count
+        if total_count == 0:
+            return 0, 0
+
+        skipped_count = total_count - inserted_count
         log.info(f"Batch insert complete. Inserted: {inserted_count}, Skipped: {skipped_count}")
         return inserted_count, skipped_count
+
+    @handle_database_errors
+    def sum_amount(
+        self,
+        currency: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Decimal:
+        """
+        在數據庫端匯總指定幣種的利息收入，避免將所有記錄加載到 Python 中求和。
+        
+        Args:
+            currency: 幣種。
+            start: 起始時間（包含），None 表示不限。
+            end: 結束時間（不包含），None 表示不限。
+            
+        Returns:
+            利息收入總額，沒有記錄時為 Decimal('0')。
+        """
+        query = """
+        SELECT COALESCE(SUM(amount), 0)
+        FROM interest_payments
+        WHERE currency = %s
+          AND (%s::timestamptz IS NULL OR paid_at >= %s::timestamptz)
+          AND (%s::timestamptz IS NULL OR paid_at < %s::timestamptz);
+        """
+        params = (currency, start, start, end, end)
+        
+        result = self.db_manager.execute_query(query, params, fetch='one')
+        return Decimal(result[0]) if result else Decimal('0')
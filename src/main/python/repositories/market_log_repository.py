@@ -44,13 +44,11 @@ class MarketLogRepository:
         ORDER BY timestamp ASC;
         """
         
-        results = self.db_manager.execute_query(query, (currency, time_threshold), fetch='all')
-
-        if not results:
-            return pd.DataFrame()
+        # 流式讀取，避免長時間窗口下一次性物化全部行
+        rows = self.db_manager.iter_query(query, (currency, time_threshold))
 
         processed_data = []
-        for timestamp, rates_data in results:
+        for timestamp, rates_data in rows:
             record = {'timestamp': timestamp}
             # The periods in rates_data are strings from JSON keys, convert them to int
             for period_str, rates in rates_data.items():
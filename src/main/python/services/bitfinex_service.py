@@ -1,14 +1,34 @@
+import hashlib
+import hmac
+import threading
+import time
 import requests
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import List, Dict, Any
 
 from src.main.python.models.daily_profit import DailyProfit
 from src.main.python.repositories.daily_profit_repository import DailyProfitRepository
 
+
+@lru_cache(maxsize=32)
+def _signature_prefix(path: str) -> bytes:
+    """簽名負載的固定前綴 (/api/<path>)，同一路徑只編碼一次"""
+    return f'/api/{path}'.encode('utf-8')
+
+
 class BitfinexService:
     def __init__(self, api_key: str, api_secret: str, db_manager):
         self.base_url = "https://api.bitfinex.com/v2/"
         self.api_key = api_key
         self.api_secret = api_secret
+        # 密鑰只編碼一次；HMAC 模板預先完成 key 的填充，每次請求只需 copy()
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, digestmod=hashlib.sha384)
+        # 嚴格遞增且跟隨時鐘的 nonce，見 _next_nonce
+        self._last_nonce = 0
+        self._nonce_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -16,13 +36,22 @@ class BitfinexService:
         })
         self.daily_profit_repository = DailyProfitRepository(db_manager)
 
+    def _next_nonce(self) -> str:
+        """
+        生成下一個 nonce：取當前微秒時間戳與上一個 nonce + 1 中的較大者
+
+        跟隨時鐘使其不會落後於同一 API key 上的其他客戶端（bfxapi 同樣使用微秒時間戳），
+        +1 保證同一微秒內或時鐘回撥時仍嚴格遞增。
+        """
+        with self._nonce_lock:
+            self._last_nonce = max(self._last_nonce + 1, int(time.time() * 1_000_000))
+            return str(self._last_nonce)
+
     def _get_auth_headers(self, nonce: str, path: str, body: str = '') -> Dict[str, str]:
-        signature_payload = f'/api/{path}{nonce}{body}'
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            signature_payload.encode('utf-8'),
-            hashlib.sha384
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(_signature_prefix(path))
+        mac.update(f'{nonce}{body}'.encode('utf-8'))
+        signature = mac.hexdigest()
 
         return {
             'bfx-nonce': nonce,
@@ -32,11 +61,12 @@ class BitfinexService:
 
     def get_daily_profits(self) -> List[DailyProfit]:
         path = 'v2/auth/r/summary'
-        nonce = str(int(time.time() * 1000))
+        nonce = self._next_nonce()
         headers = self._get_auth_headers(nonce, path)
         response = self.session.post(f'{self.base_url}{path}', headers=headers)
         response.raise_for_status()
-        data = response.json()
+        # 浮點數直接解析為 Decimal，避免 float 中轉造成的精度損失和二次轉換
+        data = response.json(parse_float=Decimal)
 
         daily_profits = []
         if data and data.get('summary') and data.get('summary').get('daily_profit'):
@@ -50,6 +80,5 @@ class BitfinexService:
                 ))
         return daily_profits
 
-    def save_daily_profits(self, daily_profits: List[DailyProfit]):
-        for profit in daily_profits:
-            self.daily_profit_repository.save_daily_profit(profit)
+    def save_daily_profits(self, daily_profits: List[DailyProfit]) -> int:
+        return self.daily_profit_repository.save_daily_profits_batch(daily_profits)
@@ -1,7 +1,9 @@
 import psycopg2
 import psycopg2.pool
+import psycopg2.extras
 import logging
-from typing import Optional, Any, List, Tuple, Union, Dict
+import uuid
+from typing import Optional, Any, List, Tuple, Union, Dict, Iterator
 from contextlib import contextmanager
 from threading import Lock
 
@@ -31,6 +33,7 @@ class DatabaseManager:
         self.pool_size = pool_size
         self.max_connections = max_connections
         self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        # 僅保護連接池的關閉/替換，不參與每次取用連接
         self._pool_lock = Lock()
         self._initialize_connection_pool()
 
@@ -73,13 +76,15 @@ class DatabaseManager:
     @contextmanager
     def get_connection(self):
         """獲取數據庫連接（上下文管理器）"""
-        if not self._pool:
+        # ThreadedConnectionPool 內部已有互斥鎖，這裡不再額外加鎖；
+        # 取本地引用，避免 close() 期間 self._pool 被置空
+        pool = self._pool
+        if not pool:
             raise DatabaseConnectionError("Connection pool not initialized")
         
         conn = None
         try:
-            with self._pool_lock:
-                conn = self._pool.getconn()
+            conn = pool.getconn()
             
             if conn is None:
                 raise DatabaseConnectionError("Failed to get connection from pool")
@@ -92,8 +97,7 @@ class DatabaseManager:
             raise
         finally:
             if conn:
-                with self._pool_lock:
-                    self._pool.putconn(conn)
+                pool.putconn(conn)
 
     @contextmanager
     def get_transaction(self):
@@ -151,13 +155,55 @@ class DatabaseManager:
                     raise DatabaseQueryError(f"Query execution failed: {e}") from e
 
     @handle_database_errors
-    def execute_many(self, query: str, params_list: List[Union[Tuple, Dict]]) -> None:
+    def iter_query(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Tuple]:
+        """
+        以服務端游標流式讀取查詢結果
+        
+        與 execute_query(fetch='all') 不同，結果按 chunk_size 分批從服務端拉取，
+        不會一次性在內存中物化整個結果集，適合大範圍歷史數據掃描。
+        
+        Args:
+            query: SQL 查詢語句
+            params: 查詢參數
+            chunk_size: 每次網絡往返拉取的行數
+        
+        Yields:
+            查詢結果的每一行
+        """
+        if not query.strip():
+            raise DatabaseQueryError("Empty query provided")
+        
+        with self.get_connection() as conn:
+            try:
+                # 命名游標即服務端游標，需在事務內使用；名稱唯一，避免同一連接上的游標衝突
+                with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+                    cur.itersize = chunk_size
+                    cur.execute(query, params)
+                    yield from cur
+                conn.commit()
+            except psycopg2.Error as e:
+                log.error(f"Streaming query failed: {e}")
+                log.debug(f"Failed query: {query}")
+                log.debug(f"Query params: {params}")
+                raise DatabaseQueryError(f"Streaming query failed: {e}") from e
+
+    @handle_database_errors
+    def execute_many(self, query: str, params_list: List[Union[Tuple, Dict]], page_size: int = 500) -> None:
         """
         批量執行 SQL 查詢
         
+        使用 execute_batch 將多組參數合併為少量網絡往返，
+        而不是 executemany 的逐條執行。
+        
         Args:
             query: SQL 查詢語句
             params_list: 參數列表
+            page_size: 每次往返合併的語句數
         """
         if not query.strip():
             raise DatabaseQueryError("Empty query provided")
@@ -169,7 +215,7 @@ class DatabaseManager:
         with self.get_transaction() as conn:
             with conn.cursor() as cur:
                 try:
-                    cur.executemany(query, params_list)
+                    psycopg2.extras.execute_batch(cur, query, params_list, page_size=page_size)
                     log.debug(f"Batch executed {len(params_list)} operations")
                     
                 except psycopg2.Error as e:
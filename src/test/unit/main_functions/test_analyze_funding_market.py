@@ -1,5 +1,7 @@
 import os
+import sys
 import asyncio
+import logging
 from dotenv import load_dotenv
 
 from typing import Optional
@@ -11,13 +13,18 @@ project_root = os.path.abspath(os.path.join(script_dir, '..', '..', '..', '..'))
 dotenv_path = os.path.join(project_root, '.env')
 load_dotenv(dotenv_path=dotenv_path)
 
+# Add project root to the Python path
+sys.path.insert(0, project_root)
+
 from bfxapi import Client
+from src.main.python.core.funding_book import reduce_book, finalize_market_rates
 
 API_KEY = os.getenv("BFX_API_KEY")
 API_SECRET = os.getenv("BFX_API_SECRET")
 LENDING_CURRENCY = "USD"
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
 
 # --- Function to Test ---
 async def analyze_funding_market(currency: str) -> dict[int, dict[str, Optional[float]]]:
@@ -29,34 +36,12 @@ async def analyze_funding_market(currency: str) -> dict[int, dict[str, Optional[
         symbol = f"f{currency}"
         book = await asyncio.to_thread(bot.rest.public.get_f_book, currency=symbol, precision="P0", len=100)
         if book and len(book) > 0:
-            for entry in book:
-                period = entry.period
-                rate = entry.rate
-                amount = entry.amount
-
-                if period not in market_rates:
-                    market_rates[period] = {'bid': 0.0, 'offer': float('inf')} # Initialize with extreme values
-
-                if amount < 0: # It's a bid (borrower wants to borrow)
-                    if rate > market_rates[period]['bid']:
-                        market_rates[period]['bid'] = rate
-                elif amount > 0: # It's an offer (lender wants to lend)
-                    if rate < market_rates[period]['offer']:
-                        market_rates[period]['offer'] = rate
+            market_rates = reduce_book(book)
     except Exception as e:
-        print(f"[ERROR] Error analyzing funding market for {currency}: {e}")
+        logger.error(f"Error analyzing funding market for {currency}: {e}")
 
     # Clean up periods where no bids or offers were found, or set to None
-    for period in list(market_rates.keys()):
-        if market_rates[period]['bid'] == 0.0 and market_rates[period]['offer'] == float('inf'):
-            del market_rates[period] # Remove if no bids or offers for this period
-        else:
-            if market_rates[period]['bid'] == 0.0:
-                market_rates[period]['bid'] = None # No bids found for this period
-            if market_rates[period]['offer'] == float('inf'):
-                market_rates[period]['offer'] = None # No offers found for this period
-
-    return market_rates
+    return finalize_market_rates(market_rates)
 
 # --- Main Execution ---
 async def main():
@@ -77,4 +62,5 @@ async def main():
     print("-------------------")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     asyncio.run(main())
@@ -1,5 +1,6 @@
 import os
 import asyncio
+import logging
 import sys
 from dotenv import load_dotenv
 from typing import Optional
@@ -16,17 +17,18 @@ API_KEY = os.getenv("BFX_API_KEY")
 API_SECRET = os.getenv("BFX_API_SECRET")
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
 
 # --- Function to Test ---
 async def cancel_funding_offer(offer_id: int):
     """Cancels a specific funding offer by ID."""
-    print(f"[INFO] Attempting to cancel offer with ID: {offer_id}")
+    logger.info(f"Attempting to cancel offer with ID: {offer_id}")
     try:
         result = await asyncio.to_thread(bot.rest.auth.cancel_funding_offer, offer_id)
-        print(f"[SUCCESS] Successfully cancelled offer: {result}")
+        logger.info(f"Successfully cancelled offer: {result}")
         return result
     except Exception as e:
-        print(f"[ERROR] Error cancelling offer {offer_id}: {e}")
+        logger.error(f"Error cancelling offer {offer_id}: {e}")
         return None
 
 # --- Main Execution ---
@@ -55,6 +57,7 @@ async def main():
     await cancel_funding_offer(offer_id_to_cancel)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     if not API_KEY or not API_SECRET:
         print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
     else:
@@ -1,6 +1,8 @@
 import os
 import asyncio
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Optional
 from bfxapi import Client
@@ -12,6 +14,11 @@ project_root = os.path.abspath(os.path.join(script_dir, '..', '..', '..', '..'))
 dotenv_path = os.path.join(project_root, '.env')
 load_dotenv(dotenv_path=dotenv_path)
 
+# Add project root to the Python path
+sys.path.insert(0, project_root)
+
+from src.main.python.core.cache import ttl_cache
+
 API_KEY = os.getenv("BFX_API_KEY")
 API_SECRET = os.getenv("BFX_API_SECRET")
 LENDING_CURRENCY = os.getenv("LENDING_CURRENCY", "USD")
@@ -20,43 +27,55 @@ MIN_INTEREST_RATE = float(os.getenv("MIN_INTEREST_RATE", 0.0001))
 MAX_LOAN_AMOUNT = float(os.getenv("MAX_LOAN_AMOUNT", 10000.0))
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
+
+# Order book snapshots are reused for a few seconds
+MARKET_CACHE_TTL_SECONDS = 5.0
+
+def clear_cache():
+    """Drop cached market rates so the next call hits the API."""
+    _fetch_market_rates.cache_clear()
+
+@ttl_cache(ttl=MARKET_CACHE_TTL_SECONDS)
+async def _fetch_market_rates(currency: str) -> dict[int, float]:
+    """Raw, cached best bid rate per period. Errors propagate and are not cached."""
+    market_rates = {}
+    symbol = f"f{currency}"
+    book = await asyncio.to_thread(bot.rest.public.get_f_book, currency=symbol, precision="P0", limit=100)
+    # Single pass: keep the best (highest) bid rate per period
+    for entry in book or ():
+        if entry.amount < 0 and entry.rate > market_rates.get(entry.period, -1.0):
+            market_rates[entry.period] = entry.rate
+    return market_rates
 
 # --- Functions to Test ---
 async def analyze_funding_market(currency: str) -> dict[int, float]:
-    market_rates = {}
     try:
-        symbol = f"f{currency}"
-        book = await asyncio.to_thread(bot.rest.public.get_f_book, currency=symbol, precision="P0", limit=100)
-        if book and len(book) > 0:
-            bids = [entry for entry in book if entry.amount < 0]
-            for bid in bids:
-                period = bid.period
-                rate = bid.rate
-                if period not in market_rates or rate > market_rates[period]:
-                    market_rates[period] = rate
+        market_rates = await _fetch_market_rates(currency)
     except Exception as e:
-        print(f"[ERROR] Error analyzing funding market for {currency}: {e}")
-    return market_rates
+        logger.error(f"Error analyzing funding market for {currency}: {e}")
+        return {}
+    # The cached snapshot is shared between calls; hand callers their own copy to mutate
+    return dict(market_rates)
 
 async def get_available_balance(currency: str):
     try:
         wallets = await asyncio.to_thread(bot.rest.auth.get_wallets)
-        for wallet in wallets:
-            if wallet.wallet_type == "funding" and wallet.currency == currency:
-                return float(wallet.available_balance)
-        return 0.0
+        wallet_index = {(wallet.wallet_type, wallet.currency): wallet for wallet in wallets}
+        wallet = wallet_index.get(("funding", currency))
+        return float(wallet.available_balance) if wallet else 0.0
     except Exception as e:
-        print(f"[ERROR] Error fetching wallets: {e}")
+        logger.error(f"Error fetching wallets: {e}")
         return 0.0
 
 async def place_lending_offer(currency: str, amount: float, rate: float, period: int):
-    print(f"[INFO] Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
+    logger.info(f"Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
     try:
         offer = await asyncio.to_thread(bot.rest.auth.submit_funding_offer, type="LIMIT", symbol=f"f{currency}", amount=amount, rate=rate, period=period)
-        print(f"[SUCCESS] Successfully placed offer: {offer}")
+        logger.info(f"Successfully placed offer: {offer}")
         return offer
     except Exception as e:
-        print(f"[ERROR] Error placing lending offer: {e}")
+        logger.error(f"Error placing lending offer: {e}")
         return None
 
 async def execute_aggressive_strategy(available_balance, market_rates):
@@ -64,10 +83,10 @@ async def execute_aggressive_strategy(available_balance, market_rates):
     best_market_bid = market_rates.get(target_period)
 
     if not best_market_bid:
-        print(f"[WARNING] No market rate found for the target period of {target_period} days. Cannot execute aggressive strategy.")
+        logger.warning(f"No market rate found for the target period of {target_period} days. Cannot execute aggressive strategy.")
         return
 
-    print(f"[INFO] Best bid for {target_period} days is {best_market_bid*100:.4f}%. Placing aggressive offer.")
+    logger.info(f"Best bid for {target_period} days is {best_market_bid*100:.4f}%. Placing aggressive offer.")
     amount_to_lend = min(available_balance, MAX_LOAN_AMOUNT)
     offer_rate = max(MIN_INTEREST_RATE, best_market_bid - 0.000001)
     if offer_rate < 0:
@@ -76,7 +95,7 @@ async def execute_aggressive_strategy(available_balance, market_rates):
     if amount_to_lend >= 150.0:
         await place_lending_offer(LENDING_CURRENCY, amount_to_lend, offer_rate, target_period)
     else:
-        print(f"[WARNING] Amount to lend {amount_to_lend} is less than minimum 150.0 {LENDING_CURRENCY}. Skipping offer placement.")
+        logger.warning(f"Amount to lend {amount_to_lend} is less than minimum 150.0 {LENDING_CURRENCY}. Skipping offer placement.")
 
 # --- Main Execution ---
 async def main():
@@ -84,14 +103,17 @@ async def main():
     print("--- Testing Aggressive Strategy ---")
     print("--- WARNING: This script may place a REAL lending offer. ---")
 
-    available_balance = await get_available_balance(LENDING_CURRENCY)
+    # The two REST calls are independent, so overlap their network waits
+    available_balance, market_rates = await asyncio.gather(
+        get_available_balance(LENDING_CURRENCY),
+        analyze_funding_market(LENDING_CURRENCY)
+    )
     print(f"Available balance: {available_balance} {LENDING_CURRENCY}")
 
     if available_balance < 150.0:
         print("Insufficient balance to run test. Minimum 150 is required.")
         return
 
-    market_rates = await analyze_funding_market(LENDING_CURRENCY)
     print(f"Market rates: {market_rates}")
 
     if not market_rates:
@@ -108,7 +130,13 @@ async def main():
     await execute_aggressive_strategy(available_balance, market_rates)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     if not API_KEY or not API_SECRET:
         print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
     else:
-        asyncio.run(main())
+        # Pre-size the executor used by asyncio.to_thread for the bfxapi REST calls
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=4, thread_name_prefix="bfx")
+            )
+            runner.run(main())
@@ -1,5 +1,6 @@
 import os
 import asyncio
+import logging
 import sys
 from dotenv import load_dotenv
 from typing import Optional
@@ -20,6 +21,7 @@ MIN_INTEREST_RATE = float(os.getenv("MIN_INTEREST_RATE", 0.0001))
 MAX_LOAN_AMOUNT = float(os.getenv("MAX_LOAN_AMOUNT", 10000.0))
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
 
 # --- Functions to Test ---
 async def analyze_funding_market(currency: str) -> dict[int, float]:
@@ -35,28 +37,27 @@ async def analyze_funding_market(currency: str) -> dict[int, float]:
                 if period not in market_rates or rate > market_rates[period]:
                     market_rates[period] = rate
     except Exception as e:
-        print(f"[ERROR] Error analyzing funding market for {currency}: {e}")
+        logger.error(f"Error analyzing funding market for {currency}: {e}")
     return market_rates
 
 async def get_available_balance(currency: str):
     try:
         wallets = await asyncio.to_thread(bot.rest.auth.get_wallets)
-        for wallet in wallets:
-            if wallet.wallet_type == "funding" and wallet.currency == currency:
-                return float(wallet.available_balance)
-        return 0.0
+        wallet_index = {(wallet.wallet_type, wallet.currency): wallet for wallet in wallets}
+        wallet = wallet_index.get(("funding", currency))
+        return float(wallet.available_balance) if wallet else 0.0
     except Exception as e:
-        print(f"[ERROR] Error fetching wallets: {e}")
+        logger.error(f"Error fetching wallets: {e}")
         return 0.0
 
 async def place_lending_offer(currency: str, amount: float, rate: float, period: int):
-    print(f"[INFO] Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
+    logger.info(f"Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
     try:
         offer = await asyncio.to_thread(bot.rest.auth.submit_funding_offer, type="LIMIT", symbol=f"f{currency}", amount=amount, rate=rate, period=period)
-        print(f"[SUCCESS] Successfully placed offer: {offer}")
+        logger.info(f"Successfully placed offer: {offer}")
         return offer
     except Exception as e:
-        print(f"[ERROR] Error placing lending offer: {e}")
+        logger.error(f"Error placing lending offer: {e}")
         return None
 
 async def execute_passive_strategy(available_balance, market_rates):
@@ -64,17 +65,17 @@ async def execute_passive_strategy(available_balance, market_rates):
     best_market_bid = market_rates.get(target_period)
 
     if not best_market_bid:
-        print(f"[WARNING] No market rate found for the target period of {target_period} days. Cannot execute passive strategy.")
+        logger.warning(f"No market rate found for the target period of {target_period} days. Cannot execute passive strategy.")
         return
 
-    print(f"[INFO] Best bid for {target_period} days is {best_market_bid*100:.4f}%. Placing passive offer.")
+    logger.info(f"Best bid for {target_period} days is {best_market_bid*100:.4f}%. Placing passive offer.")
     amount_to_lend = min(available_balance, MAX_LOAN_AMOUNT)
     offer_rate = max(MIN_INTEREST_RATE, best_market_bid + 0.000001)
     
     if amount_to_lend >= 150.0:
         await place_lending_offer(LENDING_CURRENCY, amount_to_lend, offer_rate, target_period)
     else:
-        print(f"[WARNING] Amount to lend {amount_to_lend} is less than minimum 150.0 {LENDING_CURRENCY}. Skipping offer placement.")
+        logger.warning(f"Amount to lend {amount_to_lend} is less than minimum 150.0 {LENDING_CURRENCY}. Skipping offer placement.")
 
 # --- Main Execution ---
 async def main():
@@ -106,6 +107,7 @@ async def main():
     await execute_passive_strategy(available_balance, market_rates)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     if not API_KEY or not API_SECRET:
         print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
     else:
@@ -1,5 +1,7 @@
 import os
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Optional
 from bfxapi import Client
@@ -16,18 +18,18 @@ API_SECRET = os.getenv("BFX_API_SECRET")
 LENDING_CURRENCY = os.getenv("LENDING_CURRENCY", "USD")
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
 
 # --- Function to Test ---
 async def get_available_balance(currency: str):
     """Fetches the available balance for lending from the funding wallet."""
     try:
         wallets = await asyncio.to_thread(bot.rest.auth.get_wallets)
-        for wallet in wallets:
-            if wallet.wallet_type == "funding" and wallet.currency == currency:
-                return float(wallet.available_balance)
-        return 0.0
+        wallet_index = {(wallet.wallet_type, wallet.currency): wallet for wallet in wallets}
+        wallet = wallet_index.get(("funding", currency))
+        return float(wallet.available_balance) if wallet else 0.0
     except Exception as e:
-        print(f"[ERROR] Error fetching wallets: {e}")
+        logger.error(f"Error fetching wallets: {e}")
         return 0.0
 
 # --- Main Execution ---
@@ -42,7 +44,13 @@ async def main():
     print("-------------------")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     if not API_KEY or not API_SECRET:
         print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
     else:
-        asyncio.run(main())
+        # Pre-size the executor used by asyncio.to_thread for the bfxapi REST calls
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=4, thread_name_prefix="bfx")
+            )
+            runner.run(main())
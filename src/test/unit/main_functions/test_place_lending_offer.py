@@ -1,6 +1,8 @@
 import os
 import asyncio
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import Optional
 from bfxapi import Client
@@ -16,11 +18,12 @@ API_KEY = os.getenv("BFX_API_KEY")
 API_SECRET = os.getenv("BFX_API_SECRET")
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
+logger = logging.getLogger(__name__)
 
 # --- Function to Test ---
 async def place_lending_offer(currency: str, amount: float, rate: float, period: int):
     """Places a new lending offer."""
-    print(f"[INFO] Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
+    logger.info(f"Attempting to place lending offer: {amount} {currency} at {rate*100:.4f}% daily for {period} days...")
     try:
         offer = await asyncio.to_thread(bot.rest.auth.submit_funding_offer,
             type="LIMIT",
@@ -29,10 +32,10 @@ async def place_lending_offer(currency: str, amount: float, rate: float, period:
             rate=rate,
             period=period
         )
-        print(f"[SUCCESS] Successfully placed offer: {offer}")
+        logger.info(f"Successfully placed offer: {offer}")
         return offer
     except Exception as e:
-        print(f"[ERROR] Error placing lending offer: {e}")
+        logger.error(f"Error placing lending offer: {e}")
         return None
 
 # --- Main Execution ---
@@ -58,7 +61,13 @@ async def main():
     await place_lending_offer(TEST_CURRENCY, TEST_AMOUNT, TEST_RATE, TEST_PERIOD)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     if not API_KEY or not API_SECRET:
         print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
     else:
-        asyncio.run(main())
+        # Pre-size the executor used by asyncio.to_thread for the bfxapi REST calls
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=4, thread_name_prefix="bfx")
+            )
+            runner.run(main())
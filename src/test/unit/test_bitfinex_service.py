@@ -0,0 +1,71 @@
+"""
+BitfinexService 單元測試
+
+測試認證頭的簽名和 nonce 生成
+"""
+
+import hashlib
+import hmac
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.main.python.services.bitfinex_service import BitfinexService
+
+
+class TestBitfinexService(unittest.TestCase):
+    """BitfinexService 測試"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.service = BitfinexService('test_key', 'test_secret', MagicMock())
+
+    def test_auth_headers_signature(self):
+        """測試簽名與 Bitfinex v2 規範一致"""
+        headers = self.service._get_auth_headers('1700000000000', 'v2/auth/r/summary', '{}')
+
+        expected = hmac.new(
+            b'test_secret',
+            b'/api/v2/auth/r/summary1700000000000{}',
+            hashlib.sha384
+        ).hexdigest()
+
+        self.assertEqual(headers['bfx-signature'], expected)
+        self.assertEqual(headers['bfx-nonce'], '1700000000000')
+        self.assertEqual(headers['bfx-apikey'], 'test_key')
+
+    def test_nonce_strictly_increasing(self):
+        """測試連續生成的 nonce 嚴格遞增"""
+        nonces = [int(self.service._next_nonce()) for _ in range(1000)]
+
+        self.assertEqual(nonces, sorted(set(nonces)))
+
+    def test_nonce_follows_clock(self):
+        """測試 nonce 跟隨時鐘前進，而不是只在初始值上遞增"""
+        with patch('src.main.python.services.bitfinex_service.time.time', return_value=1700000000.0):
+            first = int(self.service._next_nonce())
+            second = int(self.service._next_nonce())
+        with patch('src.main.python.services.bitfinex_service.time.time', return_value=1700003600.0):
+            later = int(self.service._next_nonce())
+
+        self.assertEqual(first, 1700000000 * 1_000_000)
+        self.assertEqual(second, first + 1)
+        self.assertEqual(later, 1700003600 * 1_000_000)
+
+    def test_nonce_unique_under_threads(self):
+        """測試多線程併發生成的 nonce 不重複"""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            batches = list(executor.map(
+                lambda _: [int(self.service._next_nonce()) for _ in range(500)],
+                range(16)
+            ))
+
+        for batch in batches:
+            # 每個線程內部也必須嚴格遞增
+            self.assertEqual(batch, sorted(set(batch)))
+        results = [nonce for batch in batches for nonce in batch]
+        self.assertEqual(len(results), 16 * 500)
+        self.assertEqual(len(set(results)), len(results))
+
+if __name__ == '__main__':
+    unittest.main()
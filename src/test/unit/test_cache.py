@@ -0,0 +1,131 @@
+"""
+ttl_cache 單元測試
+
+測試併發合併、異常不緩存、TTL 過期、容量淘汰、清空緩存和取消隔離
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from src.main.python.core.cache import ttl_cache
+
+
+class TestTtlCache(unittest.IsolatedAsyncioTestCase):
+    """ttl_cache 測試"""
+
+    async def test_concurrent_misses_share_one_call(self):
+        """測試併發未命中共享同一個底層調用"""
+        calls = 0
+        release = asyncio.Event()
+
+        @ttl_cache(ttl=60)
+        async def fetch(x):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return x * 2
+
+        waiters = [asyncio.ensure_future(fetch(21)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*waiters), [42] * 5)
+        self.assertEqual(calls, 1)
+
+    async def test_exceptions_not_cached(self):
+        """測試異常不會被緩存"""
+        calls = 0
+
+        @ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with self.assertRaises(RuntimeError):
+            await fetch()
+        self.assertEqual(await fetch(), "ok")
+        self.assertEqual(calls, 2)
+
+    async def test_ttl_expiry(self):
+        """測試過期後重新調用底層函數"""
+        calls = 0
+        now = [1000.0]
+
+        @ttl_cache(ttl=10)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        with patch('src.main.python.core.cache.time.monotonic', side_effect=lambda: now[0]):
+            self.assertEqual(await fetch(), 1)
+            now[0] += 9
+            self.assertEqual(await fetch(), 1)
+            now[0] += 2
+            self.assertEqual(await fetch(), 2)
+
+    async def test_maxsize_evicts_least_recently_used(self):
+        """測試超過 maxsize 時淘汰最久未使用的條目"""
+        calls = []
+
+        @ttl_cache(ttl=60, maxsize=2)
+        async def fetch(x):
+            calls.append(x)
+            return x
+
+        await fetch(1)
+        await fetch(2)
+        await fetch(1)  # 命中，1 成為最近使用
+        await fetch(3)  # 淘汰 2
+        await fetch(1)
+        await fetch(2)
+
+        self.assertEqual(calls, [1, 2, 3, 2])
+
+    async def test_cache_clear(self):
+        """測試 cache_clear 清空緩存"""
+        calls = 0
+
+        @ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        self.assertEqual(await fetch(), 1)
+        self.assertEqual(await fetch(), 1)
+        fetch.cache_clear()
+        self.assertEqual(await fetch(), 2)
+
+    async def test_cancelled_caller_does_not_break_other_waiters(self):
+        """測試單個調用方被取消不影響其他等待者"""
+        calls = 0
+        release = asyncio.Event()
+
+        @ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        first = asyncio.ensure_future(fetch())
+        second = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        self.assertEqual(await second, "value")
+        self.assertEqual(await fetch(), "value")
+        self.assertEqual(calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@
 """
 
 import os
+import shutil
 import tempfile
 import unittest
 from decimal import Decimal
@@ -17,14 +18,8 @@ from src.main.python.core.exceptions import ConfigurationError
 class TestConfigManager(unittest.TestCase):
     """配置管理器測試"""
     
-    def setUp(self):
-        """設置測試環境"""
-        # 創建臨時 .env 文件
-        self.temp_dir = tempfile.mkdtemp()
-        self.env_file = os.path.join(self.temp_dir, '.env')
-        
-        # 基本配置內容
-        self.basic_config = """
+    # 基本配置內容
+    basic_config = """
 # API Configuration
 API_KEY=test_api_key
 API_SECRET=test_api_secret
@@ -55,12 +50,30 @@ LOG_FORMAT=%(asctime)s - %(name)s - %(levelname)s - %(message)s
 LOG_FILE_ENABLED=false
 """
     
+    @classmethod
+    def setUpClass(cls):
+        """創建整個測試類共用的臨時目錄和只讀測試使用的默認配置管理器"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.shared_env_file = os.path.join(cls.temp_dir, 'default.env')
+        with open(cls.shared_env_file, 'w') as f:
+            f.write(cls.basic_config)
+        cls.default_config_manager = ConfigManager(cls.shared_env_file)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """清理共用的測試環境"""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
+    def setUp(self):
+        """設置測試環境"""
+        # 每個測試只在共用目錄中重寫 .env 文件
+        self.env_file = os.path.join(self.temp_dir, '.env')
+    
     def tearDown(self):
         """清理測試環境"""
         # 清理臨時文件
         if os.path.exists(self.env_file):
             os.remove(self.env_file)
-        os.rmdir(self.temp_dir)
         
         # 重置全局配置管理器
         import src.main.python.core.config as config_module
@@ -74,10 +87,7 @@ LOG_FILE_ENABLED=false
     
     def test_basic_config_loading(self):
         """測試基本配置加載"""
-        self.create_env_file()
-        
-        config_manager = ConfigManager(self.env_file)
-        config = config_manager.config
+        config = self.default_config_manager.config
         
         # 測試 API 配置
         self.assertEqual(config.api.key, "test_api_key")
@@ -99,12 +109,8 @@ LOG_FILE_ENABLED=false
     
     def test_config_validation(self):
         """測試配置驗證"""
-        self.create_env_file()
-        
-        config_manager = ConfigManager(self.env_file)
-        
         # 基本配置應該通過驗證
-        self.assertTrue(config_manager.validate_config())
+        self.assertTrue(self.default_config_manager.validate_config())
     
     def test_invalid_strategy_name(self):
         """測試無效策略名稱"""
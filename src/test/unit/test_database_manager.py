@@ -0,0 +1,97 @@
+"""
+DatabaseManager 單元測試
+
+測試 iter_query 的服務端游標流式讀取
+"""
+
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import psycopg2
+
+from src.main.python.core.exceptions import DatabaseError
+from src.main.python.services.database_manager import DatabaseManager
+
+
+class _FakeNamedCursor:
+    """模擬 psycopg2 命名游標：迭代時按 itersize 分批從「服務端」拉取"""
+
+    def __init__(self, name, rows, fail_on_execute=False):
+        self.name = name
+        self.itersize = 2000
+        self._rows = rows
+        self._fail_on_execute = fail_on_execute
+        self.fetch_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if self._fail_on_execute:
+            raise psycopg2.Error("query failed")
+
+    def __iter__(self):
+        position = 0
+        while position < len(self._rows):
+            chunk = self._rows[position:position + self.itersize]
+            self.fetch_sizes.append(len(chunk))
+            position += len(chunk)
+            yield from chunk
+
+
+class TestIterQuery(unittest.TestCase):
+    """iter_query 測試"""
+
+    def setUp(self):
+        """設置不連接數據庫的 DatabaseManager"""
+        self.rows = [(i, f"row-{i}") for i in range(2505)]
+        self.cursors = []
+        self.fail_on_execute = False
+        self.conn = MagicMock()
+        self.conn.cursor.side_effect = self._make_cursor
+
+        self.manager = DatabaseManager.__new__(DatabaseManager)
+
+        @contextmanager
+        def get_connection():
+            yield self.conn
+
+        self.manager.get_connection = get_connection
+
+    def _make_cursor(self, name=None):
+        cursor = _FakeNamedCursor(name, self.rows, self.fail_on_execute)
+        self.cursors.append(cursor)
+        return cursor
+
+    def test_yields_every_row_across_chunks(self):
+        """測試跨越多個批次邊界時逐行返回全部結果"""
+        result = list(self.manager.iter_query("SELECT 1", chunk_size=1000))
+
+        self.assertEqual(result, self.rows)
+        self.assertEqual(self.cursors[0].fetch_sizes, [1000, 1000, 505])
+        self.conn.commit.assert_called_once()
+
+    def test_cursor_names_are_unique(self):
+        """測試每次查詢使用唯一的服務端游標名"""
+        list(self.manager.iter_query("SELECT 1"))
+        list(self.manager.iter_query("SELECT 1"))
+
+        names = [cursor.name for cursor in self.cursors]
+        self.assertTrue(all(name and name.startswith("stream_") for name in names))
+        self.assertNotEqual(names[0], names[1])
+
+    def test_errors_are_translated(self):
+        """測試迭代期間的 psycopg2 錯誤被轉換為數據庫異常"""
+        self.fail_on_execute = True
+
+        with self.assertRaises(DatabaseError):
+            list(self.manager.iter_query("SELECT 1"))
+        self.conn.commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
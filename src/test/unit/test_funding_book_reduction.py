@@ -0,0 +1,85 @@
+"""
+資金簿歸約單元測試
+
+驗證純 Python 與 NumPy 兩條歸約路徑結果一致，以及按訂單簿大小分派
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.main.python.core import funding_book
+from src.main.python.core.funding_book import (
+    NUMPY_MIN_BOOK_SIZE,
+    _reduce_book_numpy,
+    _reduce_book_python,
+    finalize_market_rates,
+    reduce_book,
+)
+
+
+def _entry(period, rate, amount):
+    return SimpleNamespace(period=period, rate=rate, amount=amount)
+
+
+class TestFundingBookReduction(unittest.TestCase):
+    """資金簿歸約測試"""
+
+    @classmethod
+    def setUpClass(cls):
+        """構造一個覆蓋各種情況、且大於 NumPy 閾值的訂單簿"""
+        book = [
+            # 2 天：雙邊都有
+            _entry(2, 0.00010, -500), _entry(2, 0.00012, -100), _entry(2, 0.00009, -50),
+            _entry(2, 0.00020, 300), _entry(2, 0.00018, 200), _entry(2, 0.00025, 10),
+            # 7 天：只有 offer（bid 側為空）
+            _entry(7, 0.00030, 1000), _entry(7, 0.00028, 50),
+            # 30 天：只有 bid（offer 側為空）
+            _entry(30, 0.00040, -20), _entry(30, 0.00041, -70),
+            # 120 天：只有零數量條目，兩側都為空
+            _entry(120, 0.00050, 0),
+        ]
+        # 填充到閾值以上，數值不影響最優價
+        book += [_entry(2, 0.00011, -1) for _ in range(NUMPY_MIN_BOOK_SIZE)]
+        cls.book = book
+
+    def test_paths_agree(self):
+        """測試兩條路徑的每期最優 bid/offer 與期數一致"""
+        python_rates = _reduce_book_python(self.book)
+        numpy_rates = _reduce_book_numpy(self.book)
+
+        self.assertEqual(sorted(python_rates), sorted(numpy_rates))
+        self.assertEqual(len(python_rates), 4)
+        for period, sides in python_rates.items():
+            with self.subTest(period=period):
+                self.assertEqual(numpy_rates[period], sides)
+
+    def test_empty_sides_and_cleanup_agree(self):
+        """測試空側及 None 清理在兩條路徑上結果一致"""
+        python_final = finalize_market_rates(_reduce_book_python(self.book))
+        numpy_final = finalize_market_rates(_reduce_book_numpy(self.book))
+
+        self.assertEqual(python_final, numpy_final)
+        self.assertNotIn(120, numpy_final)
+        self.assertEqual(numpy_final[2], {'bid': 0.00012, 'offer': 0.00018})
+        self.assertEqual(numpy_final[7], {'bid': None, 'offer': 0.00028})
+        self.assertEqual(numpy_final[30], {'bid': 0.00041, 'offer': None})
+
+    def test_dispatch_by_size(self):
+        """測試低於閾值走純 Python 路徑，達到閾值走 NumPy 路徑"""
+        cases = (
+            (self.book[:NUMPY_MIN_BOOK_SIZE - 1], '_reduce_book_python', '_reduce_book_numpy'),
+            (self.book[:NUMPY_MIN_BOOK_SIZE], '_reduce_book_numpy', '_reduce_book_python'),
+        )
+        for book, expected, unexpected in cases:
+            with self.subTest(size=len(book)):
+                with patch.object(funding_book, expected, return_value={}) as called, \
+                        patch.object(funding_book, unexpected) as not_called:
+                    reduce_book(book)
+
+                called.assert_called_once_with(book)
+                not_called.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+get_daily_profit 工具單元測試
+
+驗證 UTC 日窗口的整數運算與 datetime 計算一致，且不受本地時區和夏令時影響
+"""
+
+import os
+import time
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from tools.get_daily_profit import _utc_day_bounds
+
+
+def _reference_bounds(day: date):
+    """用 datetime 計算的參考結果"""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    end = start + timedelta(days=1) - timedelta(milliseconds=1)
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+class TestUtcDayBounds(unittest.TestCase):
+    """_utc_day_bounds 測試"""
+
+    # 包含美國 / 歐洲夏令時切換日、閏日和年末
+    DAYS = [
+        date(1970, 1, 1),
+        date(2024, 2, 29),
+        date(2024, 3, 10), date(2024, 11, 3),
+        date(2024, 3, 31), date(2024, 10, 27),
+        date(2024, 12, 31),
+    ]
+
+    def test_matches_datetime_reference(self):
+        """測試與 datetime 計算的 UTC 日邊界一致"""
+        for day in self.DAYS:
+            with self.subTest(day=day):
+                self.assertEqual(_utc_day_bounds(day), _reference_bounds(day))
+
+    def test_full_year_is_contiguous(self):
+        """測試連續日期的窗口首尾相接且每天恰好 24 小時"""
+        day = date(2024, 1, 1)
+        previous_end = _utc_day_bounds(day - timedelta(days=1))[1]
+        while day.year == 2024:
+            start, end = _utc_day_bounds(day)
+            self.assertEqual(start, previous_end + 1)
+            self.assertEqual(end - start + 1, 86_400_000)
+            previous_end = end
+            day += timedelta(days=1)
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "time.tzset is not available on this platform")
+    def test_independent_of_local_timezone(self):
+        """測試在有夏令時的本地時區下結果不變"""
+        expected = [_utc_day_bounds(day) for day in self.DAYS]
+        original_tz = os.environ.get('TZ')
+        try:
+            for tz in ('America/New_York', 'Europe/London', 'Asia/Taipei'):
+                os.environ['TZ'] = tz
+                time.tzset()
+                with self.subTest(tz=tz):
+                    self.assertEqual([_utc_day_bounds(day) for day in self.DAYS], expected)
+        finally:
+            if original_tz is None:
+                os.environ.pop('TZ', None)
+            else:
+                os.environ['TZ'] = original_tz
+            time.tzset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+FundingBot.sync_interest_payments 單元測試
+
+以假的 get_ledgers 和利息支付倉庫驅動分頁同步，測試停止條件與 end 游標
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import src.main.python.main as main_module
+from src.main.python.main import FundingBot
+
+PAGE_SIZE = 3
+
+
+def _ledger(ledger_id, mts):
+    """構造一條資金收益 ledger 記錄"""
+    return SimpleNamespace(
+        id=ledger_id, currency='UST', amount=0.5, mts=mts,
+        description=f'Margin Funding Payment on wallet funding #{ledger_id}'
+    )
+
+
+class _FakeLedgerApi:
+    """模擬 bfx.rest.auth.get_ledgers：按 end 游標從新到舊返回記錄"""
+
+    def __init__(self, ledgers):
+        self._ledgers = ledgers
+        self.end_args = []
+
+    def get_ledgers(self, currency, end=None, limit=25):
+        self.end_args.append(end)
+        matching = [entry for entry in self._ledgers if end is None or entry.mts <= end]
+        return matching[:limit]
+
+
+class _FakePaymentRepository:
+    """模擬 InterestPaymentRepository.save_payments_batch 的 ON CONFLICT DO NOTHING 語義"""
+
+    def __init__(self, existing_ids=()):
+        self.ledger_ids = set(existing_ids)
+
+    def save_payments_batch(self, payments):
+        inserted = skipped = 0
+        for payment in payments:
+            if payment.ledger_id in self.ledger_ids:
+                skipped += 1
+            else:
+                self.ledger_ids.add(payment.ledger_id)
+                inserted += 1
+        return inserted, skipped
+
+
+class TestSyncInterestPayments(unittest.IsolatedAsyncioTestCase):
+    """sync_interest_payments 分頁同步測試"""
+
+    def setUp(self):
+        for name, value in (('_LEDGER_PAGE_SIZE', PAGE_SIZE), ('_LEDGER_PAGE_DELAY_SECONDS', 0)):
+            patcher = patch.object(main_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _make_bot(self, ledgers, existing_ids=()):
+        api = _FakeLedgerApi(ledgers)
+        repo = _FakePaymentRepository(existing_ids)
+
+        bot = FundingBot.__new__(FundingBot)
+        bot.config = SimpleNamespace(trading=SimpleNamespace(lending_currency='UST'))
+        bot.bfx = MagicMock()
+        bot.bfx.rest.auth.get_ledgers = api.get_ledgers
+        bot.interest_payment_repo = repo
+        return bot, api, repo
+
+    async def test_stops_on_short_last_page(self):
+        """測試返回不足一頁時停止，且所有記錄都被保存"""
+        ledgers = [_ledger(i, 10_000 - i * 100) for i in range(1, 6)]
+        bot, api, repo = self._make_bot(ledgers)
+
+        await bot.sync_interest_payments()
+
+        self.assertEqual(len(api.end_args), 2)
+        self.assertEqual(repo.ledger_ids, {1, 2, 3, 4, 5})
+
+    async def test_stops_when_caught_up(self):
+        """測試某頁記錄全部已存在時停止，不再拉取更早的頁面"""
+        ledgers = [_ledger(i, 10_000 - i * 100) for i in range(1, 10)]
+        bot, api, repo = self._make_bot(ledgers, existing_ids=range(4, 10))
+
+        await bot.sync_interest_payments()
+
+        self.assertEqual(len(api.end_args), 2)
+        self.assertEqual(repo.ledger_ids, set(range(1, 10)))
+
+    async def test_next_end_is_oldest_mts_minus_one(self):
+        """測試下一頁的 end 游標取本頁最小 mts 減一，而不是最後一條的 mts"""
+        ledgers = [_ledger(1, 9_000), _ledger(2, 7_000), _ledger(3, 8_000), _ledger(4, 6_000)]
+        bot, api, _ = self._make_bot(ledgers)
+
+        await bot.sync_interest_payments()
+
+        self.assertEqual(api.end_args, [None, 6_999])
+
+    async def test_warns_when_max_pages_exhausted(self):
+        """測試達到 max_pages 仍未追上時記錄警告"""
+        ledgers = [_ledger(i, 10_000 - i * 100) for i in range(1, 10)]
+        bot, api, repo = self._make_bot(ledgers)
+
+        with self.assertLogs('FundingBot', level='WARNING') as logs:
+            await bot.sync_interest_payments(max_pages=2)
+
+        self.assertEqual(len(api.end_args), 2)
+        self.assertEqual(len(repo.ledger_ids), 2 * PAGE_SIZE)
+        self.assertIn('Stopped after 2 ledger pages', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
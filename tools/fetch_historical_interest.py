@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import os
+import re
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Any, Iterator, Optional
 
 from dotenv import load_dotenv
 from bfxapi import Client
@@ -32,8 +33,17 @@ class HistoricalFetcher:
 
     # Bitfinex API 一次請求返回的最大記錄數
     API_LIMIT = 2500
-    # 篩選帳本描述的關鍵字
+    # 利息支付在 Bitfinex 帳本中的類別（Margin Swap Interest Payment），由服務端過濾
+    INTEREST_LEDGER_CATEGORY = 28
+    # 篩選帳本描述的關鍵字（服務端過濾結果異常時在本地過濾），編譯為單個正則
     INTEREST_KEYWORDS = ["interest payment", "margin funding payment"]
+    _INTEREST_RE = re.compile('|'.join(map(re.escape, INTEREST_KEYWORDS)), re.IGNORECASE)
+    # 認證請求之間的間隔（約 60 次/分鐘）。同一 API key 的認證請求必須逐個發送：
+    # Bitfinex 拒絕 nonce 不大於上一個已接受 nonce 的請求，併發請求會因到達順序亂序而失敗
+    REQUEST_INTERVAL_SECONDS = 1
+    # 單頁請求的最大嘗試次數，以及重試前的等待秒數
+    MAX_PAGE_ATTEMPTS = 3
+    RETRY_DELAY_SECONDS = 10
 
     def __init__(self, config: AppConfig):
         self.config = config
@@ -44,73 +54,107 @@ class HistoricalFetcher:
             api_secret=self.config.api.secret
         )
 
-    async def fetch_all_interest_payments(self, currency: str):
-        """主函數，分頁獲取並存儲指定幣種的所有利息記錄。"""
+    async def fetch_all_interest_payments(self, currency: str) -> bool:
+        """
+        主函數，以 end 游標向更早的記錄逐頁獲取並存儲指定幣種的所有利息記錄。
+
+        每頁拉取完成後立即保存，中途失敗只會丟失尚未拉取的頁面。
+
+        Returns:
+            是否已拉取到最早的記錄；某頁重試後仍然失敗時返回 False。
+        """
         log.info(f"Starting historical interest fetch for currency: {currency}")
-        
-        total_inserted = 0
-        total_skipped = 0
+
+        total_found = total_inserted = total_skipped = 0
+        completed = False
         end_mts = int(datetime.now().timestamp() * 1000)
 
         while True:
             log.info(f"Fetching ledger entries before: {datetime.fromtimestamp(end_mts / 1000)}")
-            
-            try:
-                ledgers = await self._fetch_ledgers_page(currency, end_mts)
-                if not ledgers:
-                    log.info("No more ledger entries found. Fetch complete.")
-                    break
-
-                # 過濾和解析利息支付記錄
-                interest_payments = self._filter_and_parse_payments(ledgers)
-                log.info(f"Found {len(interest_payments)} interest payments in this batch of {len(ledgers)} ledgers.")
-
-                if interest_payments:
-                    # 批量保存到資料庫
-                    inserted, skipped = self.payment_repo.save_payments_batch(interest_payments)
-                    total_inserted += inserted
-                    total_skipped += skipped
-                    log.info(f"Batch saved. Inserted: {inserted}, Skipped: {skipped}")
-                
-                # 更新下一次請求的結束時間戳
-                end_mts = ledgers[-1].mts - 1
-
-                # 避免過於頻繁地請求 API
-                await asyncio.sleep(2)
+            ledgers = await self._fetch_page_with_retry(currency, end_mts)
+            if ledgers is None:
+                log.error(f"Giving up on ledger entries before {datetime.fromtimestamp(end_mts / 1000)}; "
+                          f"older history was not fetched.")
+                break
+            if not ledgers:
+                log.info("No more ledger entries found. Fetch complete.")
+                completed = True
+                break
 
-            except Exception as e:
-                log.error(f"An error occurred during fetch: {e}", exc_info=True)
+            # 翻頁游標取自原始頁面，與過濾結果無關
+            page_size, oldest_mts = len(ledgers), ledgers[-1].mts
+            payments = list(self._filter_and_parse_payments(ledgers))
+            inserted, skipped = self.payment_repo.save_payments_batch(payments)
+            total_found += len(payments)
+            total_inserted += inserted
+            total_skipped += skipped
+            log.info(f"Found {len(payments)} interest payments in {page_size} ledgers. "
+                     f"Inserted: {inserted}, Skipped: {skipped}")
+
+            if page_size < self.API_LIMIT:
+                log.info("Reached the oldest ledger entry. Fetch complete.")
+                completed = True
                 break
-        
+
+            # 更新下一次請求的結束時間戳，並限制整體請求頻率
+            end_mts = oldest_mts - 1
+            await asyncio.sleep(self.REQUEST_INTERVAL_SECONDS)
+
         log.info("--- Historical Fetch Summary ---")
+        log.info(f"Interest payments found: {total_found}")
         log.info(f"Total new payments inserted: {total_inserted}")
         log.info(f"Total existing payments skipped: {total_skipped}")
         log.info("----------------------------------")
+        return completed
 
-    async def _fetch_ledgers_page(self, currency: str, end_mts: int) -> List[Dict[str, Any]]:
-        """異步獲取單頁的帳本記錄。"""
+    async def _fetch_page_with_retry(self, currency: str, end_mts: int) -> Optional[List[Any]]:
+        """拉取單頁帳本，失敗時重試；用盡重試次數後返回 None。"""
+        for attempt in range(1, self.MAX_PAGE_ATTEMPTS + 1):
+            try:
+                return await self._fetch_ledgers_page(currency, end_mts)
+            except Exception as e:
+                log.warning(f"Attempt {attempt}/{self.MAX_PAGE_ATTEMPTS} failed for ledger entries before "
+                            f"{datetime.fromtimestamp(end_mts / 1000)}: {e}")
+                if attempt < self.MAX_PAGE_ATTEMPTS:
+                    await asyncio.sleep(self.RETRY_DELAY_SECONDS)
+        return None
+
+    async def _fetch_ledgers_page(self, currency: str, end_mts: int) -> List[Any]:
+        """異步獲取單頁的帳本記錄，只請求利息支付類別。"""
         return await asyncio.to_thread(
             self.bfx.rest.auth.get_ledgers,
             currency=currency,
+            category=self.INTEREST_LEDGER_CATEGORY,
             limit=self.API_LIMIT,
             end=end_mts
         )
 
-    def _filter_and_parse_payments(self, ledgers: List[Any]) -> List[InterestPayment]:
-        """從帳本記錄中過濾出利息支付並解析為 InterestPayment 對象。"""
-        payments = []
-        for entry in ledgers:
-            # bfxapi 返回的是對象，而不是字典
-            description = getattr(entry, 'description', '').lower()
-            if any(keyword in description for keyword in self.INTEREST_KEYWORDS):
-                try:
-                    # 將對象轉換為字典以便 from_ledger_entry 處理
-                    entry_dict = entry.__dict__
-                    payment = InterestPayment.from_ledger_entry(entry_dict)
-                    payments.append(payment)
-                except ValueError as e:
-                    log.warning(f"Skipping ledger entry due to parsing error: {e}. Entry: {entry}")
-        return payments
+    def _filter_and_parse_payments(self, ledgers: List[Any]) -> Iterator[InterestPayment]:
+        """從帳本記錄中過濾出利息支付，逐條解析並產出 InterestPayment 對象。"""
+        if not ledgers:
+            return
+
+        if self._is_interest_entry(ledgers[0]):
+            # 服務端已按類別過濾，只抽查首條記錄，無需逐條匹配
+            candidates = ledgers
+        else:
+            log.warning("Ledger page returned by category filter contains non-interest entries; filtering locally.")
+            # 每條描述只用一個已編譯的正則掃描一次，只為命中的記錄構造對象
+            candidates = [entry for entry in ledgers if self._is_interest_entry(entry)]
+
+        for entry in candidates:
+            try:
+                # from_ledger_entry 直接讀取 bfxapi 返回對象的屬性，無需轉換為字典
+                payment = InterestPayment.from_ledger_entry(entry)
+            except ValueError as e:
+                log.warning(f"Skipping ledger entry due to parsing error: {e}. Entry: {entry}")
+                continue
+            yield payment
+
+    def _is_interest_entry(self, entry: Any) -> bool:
+        """根據描述判斷單條帳本記錄是否為利息支付。"""
+        description = getattr(entry, 'description', '') or ''
+        return self._INTEREST_RE.search(description) is not None
 
     def close(self):
         """關閉資料庫連接。"""
@@ -118,8 +162,8 @@ class HistoricalFetcher:
             self.db_manager.close()
             log.info("Database connection closed.")
 
-async def main():
-    """腳本主入口。"""
+async def main() -> int:
+    """腳本主入口，返回進程退出碼。"""
     # 加載 .env 文件
     load_dotenv(dotenv_path=os.path.join(project_root, '.env'))
     
@@ -132,11 +176,13 @@ async def main():
         # 從配置中獲取要查詢的幣種
         currency_to_fetch = config.trading.lending_currency
         
-        # 執行獲取
-        await fetcher.fetch_all_interest_payments(currency_to_fetch)
+        # 執行獲取；有頁面最終失敗時以非零退出碼結束，避免歷史數據缺失被忽略
+        completed = await fetcher.fetch_all_interest_payments(currency_to_fetch)
+        return 0 if completed else 1
 
     except Exception as e:
         log.critical(f"A critical error occurred: {e}", exc_info=True)
+        return 1
     finally:
         if fetcher:
             fetcher.close()
@@ -144,4 +190,4 @@ async def main():
 if __name__ == "__main__":
     # 設置工作目錄到專案根目錄
     os.chdir(project_root)
-    asyncio.run(main())
+    sys.exit(asyncio.run(main()))
@@ -1,7 +1,10 @@
 import os
 import asyncio
+import numpy as np
+import pandas as pd
 from bfxapi import Client
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from typing import Tuple
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -11,6 +14,21 @@ load_dotenv()
 BFX_API_KEY = os.getenv("BFX_API_KEY")
 BFX_API_SECRET = os.getenv("BFX_API_SECRET")
 
+# Ledger window arithmetic (UTC days, Bitfinex timestamps are UTC epoch ms)
+_EPOCH = date(1970, 1, 1)
+_DAY_MS = 86_400_000
+
+def _utc_day_bounds(day: date) -> Tuple[int, int]:
+    """
+    Returns the inclusive [start, end] epoch-millisecond bounds of a UTC calendar day.
+
+    Bitfinex ledger timestamps are UTC epoch ms, so the day is taken in UTC rather than
+    local time; UTC days are always exactly 24h, so local DST changes do not affect them.
+    Pure integer arithmetic, no datetime/mktime round trip.
+    """
+    start_ms = (day - _EPOCH).days * _DAY_MS
+    return start_ms, start_ms + _DAY_MS - 1
+
 # Create a client instance
 bfx = Client(
     api_key=BFX_API_KEY,
@@ -22,13 +40,11 @@ async def get_daily_profit():
     Fetches and prints the daily funding profit summary by analyzing ledger entries.
     """
     try:
-        today = datetime.now()
-        yesterday = today - timedelta(days=1)
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
         
-        start_of_yesterday = int(yesterday.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000)
-        end_of_yesterday = int(yesterday.replace(hour=23, minute=59, second=59, microsecond=999).timestamp() * 1000)
+        start_of_yesterday, end_of_yesterday = _utc_day_bounds(yesterday)
 
-        print(f"Fetching ledger entries for {yesterday.strftime('%Y-%m-%d')}...")
+        print(f"Fetching ledger entries for {yesterday.isoformat()} (UTC)...")
         ledgers = await asyncio.to_thread(bfx.rest.auth.get_ledgers,
             currency='USD',
             start=start_of_yesterday,
@@ -37,18 +53,19 @@ async def get_daily_profit():
         )
         print(f"Found {len(ledgers)} ledger entries.")
 
-        daily_profit = {}
-        for entry in ledgers:
-            # Ledger entry format: [ID, CURRENCY, WALLET, MTS, AMOUNT, BALANCE, DESCRIPTION]
-            currency = entry.currency
-            amount = entry.amount
-            description = entry.description
+        # Columnar view of the page: one float64 reduction instead of a Python += loop
+        count = len(ledgers)
+        amounts = np.fromiter((entry.amount for entry in ledgers), dtype=np.float64, count=count)
+        currencies = np.array([entry.currency for entry in ledgers], dtype=object)
+        descriptions = pd.Series([entry.description or '' for entry in ledgers], dtype=object)
 
-            # Filter for funding interest income. Adjust description as needed based on actual ledger entries.
-            if "Funding" in description and amount > 0: # Assuming positive amount means income
-                if currency not in daily_profit:
-                    daily_profit[currency] = 0
-                daily_profit[currency] += amount
+        # Filter for funding interest income. Adjust description as needed based on actual ledger entries.
+        # Assuming positive amount means income
+        mask = (amounts > 0) & descriptions.str.contains("Funding", regex=False).to_numpy()
+
+        daily_profit = {}
+        if mask.any():
+            daily_profit = pd.Series(amounts[mask]).groupby(currencies[mask]).sum().to_dict()
 
         print("\nDaily Funding Profit Summary:")
         if daily_profit:
@@ -1,5 +1,6 @@
 import os
 import asyncio
+import logging
 from dotenv import load_dotenv
 from bfxapi import Client
 from typing import Optional
@@ -9,15 +10,28 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 dotenv_path = os.path.join(script_dir, '.env')
 load_dotenv(dotenv_path=dotenv_path)
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+log = logging.getLogger(__name__)
+
 API_KEY = os.getenv("BFX_API_KEY")
 API_SECRET = os.getenv("BFX_API_SECRET")
 
 bot = Client(api_key=API_KEY, api_secret=API_SECRET)
 
+# Authenticated Bitfinex calls on one API key must be sent one at a time: the server
+# rejects any request whose nonce is not larger than the last one it accepted, so
+# concurrent requests that arrive out of order fail with "nonce: small".
+# Callers may still gather the fetchers; the REST calls themselves are serialized here.
+MAX_CONCURRENT_AUTH_REQUESTS = 1
+request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AUTH_REQUESTS)
+
+# Bitfinex ledger category for funding interest payments (Margin Swap Interest Payment)
+FUNDING_PAYMENT_LEDGER_CATEGORY = 28
+
 async def get_historical_funding_offers(currency: str, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None, limit: int = 100):
     """Fetches historical funding offers for a given currency."""
     if not API_KEY or not API_SECRET:
-        print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
+        log.critical("API_KEY and API_SECRET must be set in the .env file.")
         return []
 
     try:
@@ -27,27 +41,21 @@ async def get_historical_funding_offers(currency: str, start_timestamp: Optional
         start_ms = start_timestamp * 1000 if start_timestamp else None
         end_ms = end_timestamp * 1000 if end_timestamp else None
 
-        offers_hist = await asyncio.to_thread(bot.rest.auth.get_funding_offers_history,
-                                               symbol=symbol,
-                                               start=start_ms,
-                                               end=end_ms,
-                                               limit=limit)
-        print(f"[INFO] Fetched {len(offers_hist)} historical funding offers for {currency}.")
-        for offer in offers_hist:
-            # You can customize the output format here
-            # Note: The amount field in historical offers might represent the original amount or remaining amount.
-            # For executed offers, the amount will be 0 as it's fully utilized.
-            # The actual interest earned is in ledgers.
-            print(f"  Offer ID: {offer.id}, Amount: {offer.amount}, Rate: {offer.rate*100:.4f}%, Period: {offer.period} days, Status: {offer.offer_status}, Created: {offer.mts_create}")
+        async with request_semaphore:
+            offers_hist = await asyncio.to_thread(bot.rest.auth.get_funding_offers_history,
+                                                   symbol=symbol,
+                                                   start=start_ms,
+                                                   end=end_ms,
+                                                   limit=limit)
         return offers_hist
     except Exception as e:
-        print(f"[ERROR] Error fetching historical funding offers: {e}")
+        log.error(f"Error fetching historical funding offers: {e}")
         return []
 
 async def get_funding_ledgers(currency: str, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None, limit: int = 100):
     """Fetches ledger entries related to funding earnings for a given currency."""
     if not API_KEY or not API_SECRET:
-        print("[FATAL] API_KEY and API_SECRET must be set in the .env file.")
+        log.critical("API_KEY and API_SECRET must be set in the .env file.")
         return []
 
     try:
@@ -55,33 +63,46 @@ async def get_funding_ledgers(currency: str, start_timestamp: Optional[int] = No
         start_ms = start_timestamp * 1000 if start_timestamp else None
         end_ms = end_timestamp * 1000 if end_timestamp else None
 
-        # Fetch all ledgers for the currency
-        ledgers = await asyncio.to_thread(bot.rest.auth.get_ledgers,
-                                          currency=currency,
-                                          start=start_ms,
-                                          end=end_ms,
-                                          limit=limit)
-        
-        print(f"[INFO] Fetched {len(ledgers)} ledger entries for {currency}.")
-        funding_earnings = []
-        for entry in ledgers:
-            # Filter for entries related to funding interest payments
-            # The description often contains keywords like 'Margin Funding Payment' or 'Funding Payment'
-            if 'funding' in entry.description.lower() and 'payment' in entry.description.lower():
-                funding_earnings.append(entry)
-                print(f"  Ledger ID: {entry.id}, Currency: {entry.currency}, Amount: {entry.amount}, Balance: {entry.balance}, Description: {entry.description}, Created: {entry.mts}")
-        
-        print(f"[INFO] Found {len(funding_earnings)} funding earnings entries for {currency}.")
+        # Let Bitfinex filter by ledger category, so only funding interest payments are returned
+        async with request_semaphore:
+            funding_earnings = await asyncio.to_thread(bot.rest.auth.get_ledgers,
+                                                       currency=currency,
+                                                       category=FUNDING_PAYMENT_LEDGER_CATEGORY,
+                                                       start=start_ms,
+                                                       end=end_ms,
+                                                       limit=limit)
+        log.info(f"Fetched {len(funding_earnings)} funding earnings entries for {currency}.")
         return funding_earnings
     except Exception as e:
-        print(f"[ERROR] Error fetching funding ledgers: {e}")
+        log.error(f"Error fetching funding ledgers: {e}")
         return []
 
-async def main():
-    print("--- Bitfinex Historical Funding Data Tool ---")
-    # Example usage: Get the last 10 historical UST funding offers
-    await get_historical_funding_offers("UST", limit=10)
+async def main(verbose: bool = True):
+    """Runs the example queries. With verbose=False only the per-section counts are logged."""
+    log.info("--- Bitfinex Historical Funding Data Tool ---")
+    # Example usage: the last 10 historical UST funding offers and the last 100 UST funding ledger entries.
+    # Both fetchers are awaited together, but their authenticated REST calls go out one at a
+    # time through request_semaphore; results are logged afterwards so sections do not interleave.
+    offers_hist, funding_earnings = await asyncio.gather(
+        get_historical_funding_offers("UST", limit=10),
+        get_funding_ledgers("UST", limit=100)
+    )
+
+    log.info(f"--- Historical Funding Offers ({len(offers_hist)}) ---")
+    if verbose and offers_hist:
+        # You can customize the output format here
+        # Note: The amount field in historical offers might represent the original amount or remaining amount.
+        # For executed offers, the amount will be 0 as it's fully utilized.
+        # The actual interest earned is in ledgers.
+        # Each section is emitted as one log record rather than one write (and flush) per entry.
+        log.info("\n" + "\n".join(
+            f"  Offer ID: {offer.id}, Amount: {offer.amount}, Rate: {offer.rate*100:.4f}%, Period: {offer.period} days, Status: {offer.offer_status}, Created: {offer.mts_create}"
+            for offer in offers_hist
+        ))
 
-    print("\n--- Bitfinex Funding Earnings (Ledgers) ---")
-    # Example usage: Get the last 100 UST funding ledger entries
-    await get_funding_ledgers("UST", limit=100)
\ No newline at end of file
+    log.info(f"--- Bitfinex Funding Earnings (Ledgers) ({len(funding_earnings)}) ---")
+    if verbose and funding_earnings:
+        log.info("\n" + "\n".join(
+            f"  Ledger ID: {entry.id}, Currency: {entry.currency}, Amount: {entry.amount}, Balance: {entry.balance}, Description: {entry.description}, Created: {entry.mts}"
+            for entry in funding_earnings
+        ))
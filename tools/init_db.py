@@ -2,12 +2,13 @@ import logging
 import os
 import sys
 from decouple import Config, RepositoryEnv
-from dotenv import load_dotenv
 
 # Add project root to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.main.python.core.config import DatabaseConfig
 from src.main.python.services.database_manager import DatabaseManager
+from src.main.python.repositories.interest_payment_repository import InterestPaymentRepository
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
@@ -15,8 +16,11 @@ log = logging.getLogger(__name__)
 def create_tables(db_manager):
     """
     Creates all necessary tables in the database.
+
+    All DDL is sent as one script inside a single transaction, so initialization
+    costs one round-trip and one commit regardless of how many tables it defines,
+    and a failure leaves no half-created schema behind.
     """
-    log.info("Creating table 'market_logs'...")
     market_log_table_query = """
     CREATE TABLE IF NOT EXISTS market_logs (
         id SERIAL PRIMARY KEY,
@@ -25,12 +29,19 @@ def create_tables(db_manager):
         rates_data JSONB NOT NULL
     );
     """
-    db_manager.execute_query(market_log_table_query)
-    log.info("Table 'market_logs' created successfully.")
 
-    # Add other table creation queries here in the future
-    # log.info("Creating table 'users'...")
-    # ...
+    schema_scripts = {
+        'market_logs': market_log_table_query,
+        # interest_payments (and its paid_at index) is defined by its repository
+        'interest_payments': InterestPaymentRepository.SCHEMA_SQL,
+        # Add other table creation queries here in the future
+    }
+
+    log.info(f"Creating tables: {', '.join(schema_scripts)}...")
+    with db_manager.get_transaction() as conn:
+        with conn.cursor() as cur:
+            cur.execute("\n".join(schema_scripts.values()))
+    log.info("Tables created successfully.")
 
 def main():
     """
@@ -38,12 +49,19 @@ def main():
     """
     log.info("--- Database Initialization Script --- ")
     try:
-        # Load config from .env file
+        # Load only the database settings from the .env file, parsed once with python-decouple
+        # (the same keys and defaults as ConfigManager, without requiring API or trading settings)
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        load_dotenv(dotenv_path=os.path.join(project_root, '.env'))
         config = Config(RepositoryEnv(os.path.join(project_root, '.env')))
+        db_config = DatabaseConfig(
+            host=config('DB_HOST', default='localhost'),
+            port=config('DB_PORT', cast=int, default=5432),
+            name=config('DB_NAME'),
+            user=config('DB_USER'),
+            password=config('DB_PASSWORD')
+        )
         
-        db_manager = DatabaseManager(config)
+        db_manager = DatabaseManager(db_config)
         create_tables(db_manager)
         db_manager.close()
         log.info("Database initialization complete.")
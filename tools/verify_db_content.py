@@ -1,46 +1,80 @@
 
 import asyncio
+import atexit
 import logging
+import os
+from decouple import Config, RepositoryEnv
 from src.main.python.core.config import DatabaseConfig
 from src.main.python.services.database_manager import DatabaseManager
 
 # 配置日誌
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+_db_manager = None
+
+def _load_database_config() -> DatabaseConfig:
+    """從專案根目錄的 .env 讀取數據庫配置（與 tools/init_db.py 相同的鍵和默認值）。"""
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    config = Config(RepositoryEnv(os.path.join(project_root, '.env')))
+    return DatabaseConfig(
+        host=config('DB_HOST', default='localhost'),
+        port=config('DB_PORT', cast=int, default=5432),
+        name=config('DB_NAME'),
+        user=config('DB_USER'),
+        password=config('DB_PASSWORD')
+    )
+
+def _get_db_manager() -> DatabaseManager:
+    """懶加載的進程內共用 DatabaseManager，同一進程內重複驗證時復用連接池。"""
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager(_load_database_config())
+        atexit.register(_close_db_manager)
+    return _db_manager
+
+def _close_db_manager():
+    """進程退出時關閉連接池。"""
+    if _db_manager:
+        _db_manager.close()
+        logging.info("Database connection closed.")
+
 async def verify_data():
     """連接到資料庫並驗證 interest_payments 表中的數據。"""
-    db_manager = None
     try:
-        # 初始化 DatabaseManager
-        db_config = DatabaseConfig()
-        db_manager = DatabaseManager(db_config)
+        db_manager = _get_db_manager()
         
-        # 查詢總記錄數
-        count_query = "SELECT COUNT(*) FROM interest_payments;"
-        count_result = db_manager.execute_query(count_query, fetch='one')
+        # 一次往返同時取得總記錄數和最近 5 條樣本；
+        # LEFT JOIN 保證表為空時仍返回一行（樣本列為 NULL），從而拿到計數
+        sample_size = 5
+        verify_query = """
+        WITH c AS (SELECT COUNT(*) AS n FROM interest_payments),
+             s AS (
+                 SELECT ledger_id, currency, amount, paid_at
+                 FROM interest_payments
+                 ORDER BY paid_at DESC
+                 LIMIT %s
+             )
+        SELECT c.n, s.ledger_id, s.currency, s.amount, s.paid_at
+        FROM c LEFT JOIN s ON TRUE
+        ORDER BY s.paid_at DESC;
+        """
+        rows = db_manager.execute_query(verify_query, (sample_size,), fetch='all')
         
-        if count_result:
-            count = count_result[0]
+        if rows:
+            count = rows[0][0]
             logging.info(f"✅ Success! The 'interest_payments' table now contains {count} rows.")
             
             if count > 0:
-                # 查詢並打印前 5 條記錄以供抽查
+                # 打印前 5 條記錄以供抽查
                 logging.info("--- Sample of first 5 entries ---")
-                sample_query = "SELECT ledger_id, currency, amount, paid_at FROM interest_payments ORDER BY paid_at DESC LIMIT 5;"
-                sample_result = db_manager.execute_query(sample_query, fetch='all')
-                if sample_result:
-                    for row in sample_result:
-                        logging.info(f"  Ledger ID: {row[0]}, Currency: {row[1]}, Amount: {row[2]:.8f}, Paid At: {row[3]}")
+                for _, ledger_id, currency, amount, paid_at in rows:
+                    logging.info(f"  Ledger ID: {ledger_id}, Currency: {currency}, Amount: {amount:.8f}, Paid At: {paid_at}")
                 logging.info("---------------------------------")
         else:
             logging.error("❌ Failed to get count from 'interest_payments' table.")
 
     except Exception as e:
         logging.error(f"An error occurred during verification: {e}", exc_info=True)
-    finally:
-        if db_manager:
-            db_manager.close()
-            logging.info("Database connection closed.")
 
 if __name__ == "__main__":
     asyncio.run(verify_data())